@@ -0,0 +1,3 @@
+# The maximum number of circuit breakers kept in memory. The least recently used breakers are discarded beyond this,
+# as breakers are created for each Octopus server the app exports, and the app can run for a long time.
+max_circuit_breakers = 1024
@@ -11,3 +11,9 @@ max_release_for_github_links = 20
 
 # The maximum number of artifacts to display
 max_github_artifacts = 5
+
+# The maximum number of concurrent requests made when fetching the channels displayed on a dashboard
+max_concurrent_channel_requests = 8
+
+# The number of seconds a space name is cached against its ID
+space_id_cache_ttl = 300
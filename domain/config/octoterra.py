@@ -0,0 +1,15 @@
+import os
+from functools import cache
+
+# The number of octoterra request bodies cached for repeated queries
+octoterra_body_cache_size = 256
+
+
+@cache
+def get_octoterra_url():
+    """
+    Returns the URL of the octoterra export endpoint. The environment does not change while the app is running,
+    so the URL is only built once.
+    :return: The octoterra export URL
+    """
+    return os.environ["APPLICATION_OCTOTERRA_URL"] + "/api/octoterra"
@@ -7,3 +7,10 @@ def get_slack_url():
     :return: The slack web hook URL
     """
     return os.environ.get("SLACK_WEBHOOK_URL")
+
+
+# The maximum number of error messages sent to Slack in a minute. Errors beyond this are only logged.
+max_slack_messages_per_minute = 30
+
+# The maximum number of messages waiting to be sent to Slack. The oldest messages are dropped beyond this.
+max_queued_slack_messages = 1024
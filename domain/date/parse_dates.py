@@ -1,11 +1,12 @@
-from datetime import timezone
+from datetime import timezone, datetime
 
 from dateutil.parser import parse
 
 
 def parse_unknown_format_date(date_string):
     try:
-        date = parse(date_string)
+        # Octopus and GitHub return ISO 8601 dates, which can be parsed much faster than the generic parser
+        date = parse_iso_date(date_string) or parse(date_string)
 
         # We need an offset aware date, so assume utc if the date format has no timezone
         if not is_offset_aware(date):
@@ -17,5 +18,12 @@ def parse_unknown_format_date(date_string):
         return None
 
 
+def parse_iso_date(date_string):
+    try:
+        return datetime.fromisoformat(date_string)
+    except (TypeError, ValueError):
+        return None
+
+
 def is_offset_aware(dt):
     return dt.tzinfo is not None and dt.tzinfo.utcoffset(dt) is not None
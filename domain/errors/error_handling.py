@@ -1,6 +1,9 @@
+import time
 import traceback
+from collections import deque
+from threading import Lock
 
-from domain.config.slack import get_slack_url
+from domain.config.slack import get_slack_url, max_slack_messages_per_minute
 from domain.logging.app_logging import configure_logging
 from domain.sanitizers.sanitize_logs import sanitize_message, anonymize_message
 from domain.validation.argument_validation import ensure_not_falsy
@@ -8,6 +11,10 @@ from infrastructure.slack import send_slack_message
 
 logger = configure_logging(__name__)
 
+# The times of the recent error messages sent to Slack
+slack_message_times = deque()
+slack_message_lock = Lock()
+
 
 def handle_error(exception):
     """
@@ -32,9 +39,39 @@ def handle_error(exception):
             logger.error(original_error_message)
         logger.error(stack_trace)
 
-        send_slack_message(error_message, get_slack_url())
+        queue_rate_limited_slack_message(error_message)
         if original_error_message:
-            send_slack_message(original_error_message, get_slack_url())
-        send_slack_message(stack_trace, get_slack_url())
+            queue_rate_limited_slack_message(original_error_message)
+        queue_rate_limited_slack_message(stack_trace)
     except Exception as e:
         logger.error(getattr(exception, 'message', repr(e)))
+
+
+def queue_rate_limited_slack_message(message):
+    """
+    Queues a message to be sent to slack by the background worker, unless too many messages have been sent
+    in the last minute
+    :param message: The message to send
+    """
+    if not slack_message_allowed():
+        logger.warning("Too many errors have been sent to Slack. The error was logged but not sent.")
+        return
+
+    send_slack_message(message, get_slack_url())
+
+
+def slack_message_allowed():
+    """
+    Limits the number of messages sent to slack so a burst of errors does not flood the channel
+    :return: True if the message can be sent, and False otherwise
+    """
+    now = time.monotonic()
+    with slack_message_lock:
+        while slack_message_times and now - slack_message_times[0] > 60:
+            slack_message_times.popleft()
+
+        if len(slack_message_times) >= max_slack_messages_per_minute:
+            return False
+
+        slack_message_times.append(now)
+        return True
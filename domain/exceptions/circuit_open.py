@@ -0,0 +1,8 @@
+class CircuitOpen(Exception):
+    """
+    Represents a request that was not attempted because recent requests to the same host have failed
+    """
+
+    def __init__(self, host):
+        self.host = host
+        super().__init__(f'Requests to {host} are failing and will not be attempted for a short time')
@@ -1,3 +1,24 @@
+# The prompt messages are static, so they are built once when the module is loaded.
+plain_text_instructions = (
+    ("system", "You understand Octopus Deploy log output."),
+    ("system", "You are a concise and helpful agent."),
+    ("system", "Answer the question given the supplied deployment log output."),
+    # The user can ask for the output in a markdown code block specifically, but we should also ask the agent
+    # to do this by default.
+    ("system", "Print any log output in a markdown code block."),
+    ("system",
+     "You must assume that the supplied deployment log and all items in it directly relate to the space, project, environment, tenant, and channel from the question."),
+)
+
+plain_text_questions = (
+    ("user", "Question: {input}"),
+    # https://help.openai.com/en/articles/6654000-best-practices-for-prompt-engineering-with-the-openai-api
+    # Put instructions at the beginning of the prompt and use ### or """ to separate the instruction and context
+    ("user", "Deployment Log: ###\n{context}\n###"),
+    ("user", "Answer:"),
+)
+
+
 def build_plain_text_prompt(few_shot=None):
     """
     Build a message prompt for the LLM that instructs it to parse plain text
@@ -8,20 +29,4 @@ def build_plain_text_prompt(few_shot=None):
     if few_shot is None:
         few_shot = []
 
-    messages = [
-        ("system", "You understand Octopus Deploy log output."),
-        ("system", "You are a concise and helpful agent."),
-        ("system", "Answer the question given the supplied deployment log output."),
-        # The user can ask for the output in a markdown code block specifically, but we should also ask the agent
-        # to do this by default.
-        ("system", "Print any log output in a markdown code block."),
-        ("system",
-         "You must assume that the supplied deployment log and all items in it directly relate to the space, project, environment, tenant, and channel from the question."),
-        *few_shot,
-        ("user", "Question: {input}"),
-        # https://help.openai.com/en/articles/6654000-best-practices-for-prompt-engineering-with-the-openai-api
-        # Put instructions at the beginning of the prompt and use ### or """ to separate the instruction and context
-        ("user", "Deployment Log: ###\n{context}\n###"),
-        ("user", "Answer:")]
-
-    return messages
+    return [*plain_text_instructions, *few_shot, *plain_text_questions]
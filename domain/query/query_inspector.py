@@ -1,5 +1,9 @@
 from domain.validation.argument_validation import ensure_string
 
+# Words in a query that indicate targets are relevant
+target_types = ("target", "machine", "agent", "listening", "ssh", "cloud region", "cloudregion", "kubernetes",
+                "ecs", "web app", "webapp", "service fabric", "servicefabric", "polling")
+
 
 def exclude_all_targets(query, entity_list):
     """
@@ -11,10 +15,12 @@ def exclude_all_targets(query, entity_list):
 
     ensure_string(query, 'query must be a string (exclude_all_targets).')
 
-    target_types = ["target", "machine", "agent", "listening", "ssh", "cloud region", "cloudregion", "kubernetes",
-                    "ecs", "web app", "webapp", "service fabric", "servicefabric", "polling"]
+    # Any named targets mean targets can't be excluded, so there is no need to scan the query
+    if entity_list:
+        return False
 
-    return not any(filter(lambda x: x in query.lower(), target_types)) and not entity_list
+    lower_query = query.lower()
+    return not any(target_type in lower_query for target_type in target_types)
 
 
 def exclude_all_runbooks(query, entity_list):
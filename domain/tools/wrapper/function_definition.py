@@ -13,7 +13,8 @@ class FunctionDefinition:
         the OpenAI tool representation of the function.
         :param function: The function that the LLM can call
         :param is_enabled: Whether the function is enabled or not
-        :param schema: The pydantic schema of the function
+        :param schema: A description of the function arguments. This is not passed to the tool, whose arguments are
+        always inferred from the function signature.
         :param callback: The callback function to use if the original function needs to confirm an action
         """
 
@@ -25,7 +26,9 @@ class FunctionDefinition:
 
         self.name = function.__name__
         self.function = function
-        self.tool = StructuredTool.from_function(function, schema)
+        self.schema = schema
+        # The second positional argument of from_function is the coroutine, so the schema must not be passed here
+        self.tool = StructuredTool.from_function(function)
         self.enabled = is_enabled
         self.callback = callback
 
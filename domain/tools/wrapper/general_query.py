@@ -1,10 +1,65 @@
-from pydantic import BaseModel
+from typing import TypedDict
 
 from domain.messages.general import build_hcl_prompt
 from domain.sanitizers.sanitized_list import sanitize_projects, sanitize_runbooks, sanitize_targets, sanitize_tenants, \
     sanitize_library_variable_sets, sanitize_environments, sanitize_feeds, sanitize_accounts, sanitize_certificates, \
     sanitize_lifecycles, sanitize_workerpools, sanitize_machinepolicies, sanitize_tenanttagsets, sanitize_projectgroups, \
-    sanitize_channels, sanitize_releases, sanitize_steps, sanitize_gitcredentials, sanitize_space, sanitize_dates
+    sanitize_channels, sanitize_releases, sanitize_steps, sanitize_variables, sanitize_gitcredentials, sanitize_space, \
+    sanitize_dates
+
+
+# Maps the keys of the body passed to the callback to the sanitizer used to clean the value supplied by the LLM,
+# and the name of the argument holding that value.
+entity_sanitizers = (
+    ("space_name", sanitize_space, "space"),
+    ("project_names", sanitize_projects, "projects"),
+    ("runbook_names", sanitize_runbooks, "runbooks"),
+    ("target_names", sanitize_targets, "targets"),
+    ("tenant_names", sanitize_tenants, "tenants"),
+    ("library_variable_sets", sanitize_library_variable_sets, "library_variable_sets"),
+    ("environment_names", sanitize_environments, "environments"),
+    ("feed_names", sanitize_feeds, "feeds"),
+    ("account_names", sanitize_accounts, "accounts"),
+    ("certificate_names", sanitize_certificates, "certificates"),
+    ("lifecycle_names", sanitize_lifecycles, "lifecycles"),
+    ("workerpool_names", sanitize_workerpools, "worker_pools"),
+    ("machinepolicy_names", sanitize_machinepolicies, "machine_policies"),
+    ("tagset_names", sanitize_tenanttagsets, "tag_sets"),
+    ("projectgroup_names", sanitize_projectgroups, "project_groups"),
+    ("channel_names", sanitize_channels, "channels"),
+    ("release_versions", sanitize_releases, "releases"),
+    ("step_names", sanitize_steps, "steps"),
+    ("variable_names", sanitize_variables, "variables"),
+    ("gitcredential_names", sanitize_gitcredentials, "git_credentials"),
+    ("dates", sanitize_dates, "dates"),
+)
+
+# These sanitizers inspect the original query, and are always called
+query_aware_sanitizers = {sanitize_space, sanitize_environments}
+
+# The sanitizer table with the query aware check resolved up front, so sanitizing the entities only reads local names
+resolved_entity_sanitizers = tuple((body_key, sanitizer, argument, sanitizer in query_aware_sanitizers)
+                                   for body_key, sanitizer, argument in entity_sanitizers)
+
+
+def sanitize_entities(query, arguments):
+    """
+    Sanitizes the resource names extracted by the LLM
+    :param query: The original query
+    :param arguments: The arguments passed to the function called by the LLM
+    :return: The body passed to the callback, with an entry for every resource type
+    """
+    body = {}
+    for body_key, sanitizer, argument, query_aware in resolved_entity_sanitizers:
+        value = arguments.get(argument)
+        if query_aware:
+            body[body_key] = sanitizer(query, value)
+        elif value:
+            body[body_key] = sanitizer(value)
+        else:
+            # Every sanitizer returns an empty list for a missing value, so skip the call
+            body[body_key] = []
+    return body
 
 
 def answer_general_query_wrapper(query, callback, logging=None):
@@ -49,29 +104,7 @@ dates: dates in the query"""
         # OpenAI will inject values for some of these lists despite the fact that there was no mention
         # of these resources anywhere in the question. We clean up the results before sending them back
         # to the client.
-        body = {
-            "space_name": sanitize_space(query, space),
-            "project_names": sanitize_projects(projects),
-            "runbook_names": sanitize_runbooks(runbooks),
-            "target_names": sanitize_targets(targets),
-            "tenant_names": sanitize_tenants(tenants),
-            "library_variable_sets": sanitize_library_variable_sets(library_variable_sets),
-            "environment_names": sanitize_environments(query, environments),
-            "feed_names": sanitize_feeds(feeds),
-            "account_names": sanitize_accounts(accounts),
-            "certificate_names": sanitize_certificates(certificates),
-            "lifecycle_names": sanitize_lifecycles(lifecycles),
-            "workerpool_names": sanitize_workerpools(worker_pools),
-            "machinepolicy_names": sanitize_machinepolicies(machine_policies),
-            "tagset_names": sanitize_tenanttagsets(tag_sets),
-            "projectgroup_names": sanitize_projectgroups(project_groups),
-            "channel_names": sanitize_channels(channels),
-            "release_versions": sanitize_releases(releases),
-            "step_names": sanitize_steps(steps),
-            "variable_names": sanitize_steps(variables),
-            "gitcredential_names": sanitize_gitcredentials(git_credentials),
-            "dates": sanitize_dates(dates)
-        }
+        body = sanitize_entities(query, locals())
 
         for key, value in kwargs.items():
             if key not in body:
@@ -86,18 +119,20 @@ dates: dates in the query"""
     return answer_general_query
 
 
-class AnswerGeneralQuery(BaseModel):
-    projects: list[str] = []
-    runbooks: list[str] = []
-    targets: list[str] = []
-    tenants: list[str] = []
-    library_variable_sets: list[str] = []
-    environments: list[str] = []
-    feeds: list[str] = []
-    accounts: list[str] = []
-    certificates: list[str] = []
-    lifecycles: list[str] = []
-    worker_pools: list[str] = []
-    machine_policies: list[str] = []
-    tag_sets: list[str] = []
-    project_groups: list[str] = []
+# Documents the resource names extracted by answer_general_query. The tool arguments sent to the LLM are inferred
+# from the function signature, not from this class.
+class AnswerGeneralQuery(TypedDict, total=False):
+    projects: list[str]
+    runbooks: list[str]
+    targets: list[str]
+    tenants: list[str]
+    library_variable_sets: list[str]
+    environments: list[str]
+    feeds: list[str]
+    accounts: list[str]
+    certificates: list[str]
+    lifecycles: list[str]
+    worker_pools: list[str]
+    machine_policies: list[str]
+    tag_sets: list[str]
+    project_groups: list[str]
@@ -1,9 +1,5 @@
 from domain.messages.general import build_hcl_prompt
-from domain.sanitizers.sanitized_list import sanitize_projects, sanitize_runbooks, sanitize_targets, sanitize_tenants, \
-    sanitize_library_variable_sets, sanitize_environments, sanitize_feeds, sanitize_accounts, sanitize_certificates, \
-    sanitize_lifecycles, sanitize_workerpools, sanitize_tenanttagsets, sanitize_steps, sanitize_space, \
-    sanitize_machinepolicies, sanitize_projectgroups, sanitize_releases, sanitize_channels, sanitize_gitcredentials, \
-    sanitize_dates
+from domain.tools.wrapper.general_query import sanitize_entities
 
 
 def answer_step_features_wrapper(query, callback, logging=None):
@@ -40,29 +36,7 @@ variables: variable names"""
         if logging:
             logging("Enter:", "answer_step_features")
 
-        body = {
-            "space_name": sanitize_space(query, space),
-            "project_names": sanitize_projects(projects),
-            "runbook_names": sanitize_runbooks(runbooks),
-            "target_names": sanitize_targets(targets),
-            "tenant_names": sanitize_tenants(tenants),
-            "library_variable_sets": sanitize_library_variable_sets(library_variable_sets),
-            "environment_names": sanitize_environments(query, environments),
-            "feed_names": sanitize_feeds(feeds),
-            "account_names": sanitize_accounts(accounts),
-            "certificate_names": sanitize_certificates(certificates),
-            "lifecycle_names": sanitize_lifecycles(lifecycles),
-            "workerpool_names": sanitize_workerpools(worker_pools),
-            "machinepolicy_names": sanitize_machinepolicies(machine_policies),
-            "tagset_names": sanitize_tenanttagsets(tag_sets),
-            "projectgroup_names": sanitize_projectgroups(project_groups),
-            "channel_names": sanitize_channels(channels),
-            "release_versions": sanitize_releases(releases),
-            "step_names": sanitize_steps(steps),
-            "variable_names": sanitize_steps(variables),
-            "gitcredential_names": sanitize_gitcredentials(git_credentials),
-            "dates": sanitize_dates(dates)
-        }
+        body = sanitize_entities(query, locals())
 
         for key, value in kwargs.items():
             if key not in body:
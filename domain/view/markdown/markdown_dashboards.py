@@ -1,14 +1,17 @@
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 
-import pytz
-
-from domain.config.octopus import max_github_artifacts
+from domain.config.octopus import max_github_artifacts, max_concurrent_channel_requests
 from domain.date.date_difference import get_date_difference_summary
 from domain.date.parse_dates import parse_unknown_format_date
-from domain.sanitizers.sanitized_list import yield_first, flatten_list
+from domain.sanitizers.sanitized_list import flatten_list
 from domain.view.markdown.markdown_icons import get_github_state_icon, get_state_icon
 from infrastructure.octopus import get_channel_cached
 
+get_name = itemgetter("Name")
+
 
 def get_octopus_project_names_response(space_name, projects):
     """
@@ -18,16 +21,13 @@ def get_octopus_project_names_response(space_name, projects):
     :return: A conversational response
     """
 
-    if not projects and (space_name is None or not space_name.strip()):
-        return "I found no projects."
+    has_space_name = space_name is not None and space_name.strip()
 
     if not projects:
-        return f"I found no projects in the space {space_name}."
+        return f"I found no projects in the space {space_name}." if has_space_name else "I found no projects."
 
-    if space_name is None or not space_name.strip():
-        return f"I found {len(projects)} projects:\n* " + "\n * ".join(projects)
-
-    return f"I found {len(projects)} projects in the space \"{space_name.strip()}\":\n* " + "\n* ".join(projects)
+    space_description = f" in the space \"{space_name.strip()}\"" if has_space_name else ""
+    return f"I found {len(projects)} projects{space_description}:\n* " + "\n* ".join(projects)
 
 
 def build_markdown_table_row(columns):
@@ -41,6 +41,7 @@ def build_markdown_table_row(columns):
     return f"| {' | '.join(columns)} |\n"
 
 
+@lru_cache(maxsize=64)
 def build_markdown_table_header_separator(count):
     """
     Builds a markdown table header separator
@@ -54,17 +55,44 @@ def build_markdown_table_header_separator(count):
     return "-".join(columns) + "\n"
 
 
-def get_env_name(dashboard, environment_id):
-    environment = next(filter(lambda e: e["Id"] == environment_id, dashboard["Environments"]), None)
-    if not environment:
-        return None
-    return environment["Name"]
+def get_environment_names_by_id(dashboard):
+    """
+    Builds a lookup of environment names from the environments listed in a dashboard
+    :param dashboard: The dashboard
+    :return: A dict mapping environment IDs to environment names
+    """
+    return {e["Id"]: e["Name"] for e in dashboard["Environments"]}
+
+
+def get_env_name(environment_names_by_id, environment_id):
+    # Callers may still pass the dashboard itself rather than the environment name lookup
+    if isinstance(environment_names_by_id.get("Environments"), list):
+        environment_names_by_id = get_environment_names_by_id(environment_names_by_id)
+    return environment_names_by_id.get(environment_id)
 
 
 def get_dashboard_response(octopus_url, space_id, space_name, dashboard, github_actions=None,
                            github_actions_status=None, pull_requests=None, issues=None):
-    now = datetime.now(pytz.utc)
-    table = f"# {space_name}\n\n"
+    now = datetime.now(timezone.utc)
+    table = [f"# {space_name}\n\n"]
+
+    # Index the dashboard once rather than scanning the lists for every cell in the table
+    environment_names_by_id = get_environment_names_by_id(dashboard)
+
+    projects_by_group = {}
+    for project in dashboard["Projects"]:
+        projects_by_group.setdefault(project["ProjectGroupId"], []).append(project)
+
+    # The dashboard lists the latest deployment first, so keep the first item for each project and environment
+    latest_deployments = {}
+    for item in dashboard["Items"]:
+        latest_deployments.setdefault((item["ProjectId"], item["EnvironmentId"]), item)
+
+    github_repo_links = {project_id: GitHubRepoLinks(github_repo) for project_id, github_repo in
+                         index_by_project(github_actions, lambda x: x["Repo"] and x["Owner"]).items()}
+    github_statuses = index_by_project(github_actions_status, lambda x: x["Status"])
+    project_pull_requests = index_by_project(pull_requests)
+    project_issues = index_by_project(issues)
 
     for project_group in dashboard["ProjectGroups"]:
 
@@ -74,44 +102,37 @@ def get_dashboard_response(octopus_url, space_id, space_name, dashboard, github_
         if github_actions_status:
             environment_names.append('GitHub')
 
-        environment_names.extend(list(map(lambda e: get_env_name(dashboard, e), project_group["EnvironmentIds"])))
+        environment_names.extend([get_env_name(environment_names_by_id, e) for e in project_group["EnvironmentIds"]])
 
         columns = [project_group['Name'], *environment_names]
-        table += build_markdown_table_row(columns)
-        table += build_markdown_table_header_separator(len(columns))
-
-        projects = list(filter(lambda p: p["ProjectGroupId"] == project_group["Id"], dashboard["Projects"]))
+        table.append(build_markdown_table_row(columns))
+        table.append(build_markdown_table_header_separator(len(columns)))
 
-        for project in projects:
-            table += f"| {project['Name']} "
+        for project in projects_by_group.get(project_group["Id"], []):
+            project_id = project["Id"]
+            row = [f"| {project['Name']} "]
 
             # Find the github repo details
-            github_repo = next(
-                filter(lambda x: x and x["ProjectId"] == project["Id"] and x["Repo"] and x["Owner"], github_actions),
-                None) if github_actions else None
+            repo_links = github_repo_links.get(project_id)
 
             # Get the GitHub Actions workflow status
             if github_actions_status:
                 github_messages = []
-                github_messages.extend(build_repo_link(github_repo))
-                github_messages.extend(get_project_workflow_status(github_actions_status, project["Id"]))
-                github_messages.extend(build_pr_response_for_project(pull_requests, project["Id"], github_repo))
-                github_messages.extend(build_issue_response_for_project(issues, project["Id"], github_repo))
+                github_messages.extend(build_repo_link(repo_links))
+                github_messages.extend(build_workflow_status(github_statuses.get(project_id)))
+                github_messages.extend(build_pr_response(project_pull_requests.get(project_id), repo_links))
+                github_messages.extend(build_issue_response(project_issues.get(project_id), repo_links))
 
                 if github_messages:
-                    table += f"| {'<br/>'.join(github_messages)}"
+                    row.append(f"| {'<br/>'.join(github_messages)}")
                 else:
-                    table += f"| ⨂ "
+                    row.append("| ⨂ ")
 
             # Get the deployment status
             for environment in project_group["EnvironmentIds"]:
-                deployment = list(
-                    filter(lambda d: d["ProjectId"] == project["Id"] and d["EnvironmentId"] == environment,
-                           dashboard["Items"]))
-
-                if len(deployment) > 0:
-                    last_deployment = deployment[0]
+                last_deployment = latest_deployments.get((project_id, environment))
 
+                if last_deployment:
                     created = parse_unknown_format_date(last_deployment["Created"])
                     difference = get_date_difference_summary(now - created)
 
@@ -123,14 +144,15 @@ def get_dashboard_response(octopus_url, space_id, space_name, dashboard, github_
                         f"{icon} [{last_deployment['ReleaseVersion']}]({url})",
                         f"⟲ {difference} ago"]
 
-                    table += f"| {'<br/>'.join(messages)}"
+                    row.append(f"| {'<br/>'.join(messages)}")
                 else:
-                    table += f"| ⨂ "
+                    row.append("| ⨂ ")
 
-            table += "|\n"
-        table += "\n"
+            row.append("|\n")
+            table.append("".join(row))
+        table.append("\n")
 
-    return table
+    return "".join(table)
 
 
 def get_project_dashboard_response(octopus_url, space_id, space_name, project_name, project_id, dashboard,
@@ -140,59 +162,71 @@ def get_project_dashboard_response(octopus_url, space_id, space_name, project_na
                                    issues=None,
                                    release_workflow_runs=None,
                                    deployment_highlights=None):
-    now = datetime.now(pytz.utc)
+    now = datetime.now(timezone.utc)
+
+    table = [f"# {space_name} / {project_name}\n\n"]
 
-    table = f"# {space_name} / {project_name}\n\n"
+    repo_links = get_repo_links(github_repo)
 
     github_details = []
-    github_details.extend(build_repo_link(github_repo))
+    github_details.extend(build_repo_link(repo_links))
     github_details.extend(get_project_workflow_status(github_actions_statuses, project_id))
-    github_details.extend(build_pr_response(pull_requests, github_repo))
-    github_details.extend(build_issue_response(issues, github_repo))
+    github_details.extend(build_pr_response(pull_requests, repo_links))
+    github_details.extend(build_issue_response(issues, repo_links))
 
     if github_details:
-        table += '<br/>'.join(github_details) + "\n\n"
+        table.append('<br/>'.join(github_details) + "\n\n")
+
+    environment_names = list(map(get_name, dashboard["Environments"]))
+    table.append(build_markdown_table_row(environment_names))
+    table.append(build_markdown_table_header_separator(len(environment_names)))
 
-    environment_names = list(map(lambda e: e["Name"], dashboard["Environments"]))
-    table += build_markdown_table_row(environment_names)
-    table += build_markdown_table_header_separator(len(environment_names))
+    # Index the deployment highlights and workflow runs rather than searching them for every deployment
+    highlights_by_deployment = group_by(deployment_highlights, "DeploymentId")
+    workflow_runs_by_release = group_by(release_workflow_runs, "ReleaseId")
 
     for environment in dashboard["Environments"]:
+        environment_id = environment["Id"]
         for release in dashboard["Releases"]:
-            if environment["Id"] in release["Deployments"]:
-                # Get the latest deployment for the release. Redeploying a release can result in many
-                # deployments for an environment and a release.
-                for deployment in yield_first(release["Deployments"][environment["Id"]]):
-                    created = parse_unknown_format_date(deployment["Created"])
-                    difference = get_date_difference_summary(now - created)
-                    icon = get_state_icon(deployment['State'], deployment['HasWarningsOrErrors'])
+            if environment_id not in release["Deployments"]:
+                table.append("| ⨂ ")
+                continue
 
-                    release_url = build_deployment_url(octopus_url, space_id, deployment['ProjectId'],
-                                                       deployment['ReleaseVersion'], deployment['DeploymentId'])
+            # Get the latest deployment for the release. Redeploying a release can result in many
+            # deployments for an environment and a release.
+            deployments = release["Deployments"][environment_id]
+            if not deployments:
+                continue
 
-                    release_details = [f"{icon} [{deployment['ReleaseVersion']}]({release_url})"]
+            deployment = deployments[0]
+            created = parse_unknown_format_date(deployment["Created"])
+            difference = get_date_difference_summary(now - created)
+            icon = get_state_icon(deployment['State'], deployment['HasWarningsOrErrors'])
 
-                    # Find any running steps
-                    release_details.extend(
-                        map(lambda x: '&ensp;' + x, get_running(deployment_highlights, deployment["DeploymentId"])))
+            release_url = build_deployment_url(octopus_url, space_id, deployment['ProjectId'],
+                                               deployment['ReleaseVersion'], deployment['DeploymentId'])
 
-                    release_details.append(f"⟲ {difference} ago")
+            release_details = [f"{icon} [{deployment['ReleaseVersion']}]({release_url})"]
 
-                    # Find any highlights in the logs
-                    release_details.extend(get_highlights(deployment_highlights, deployment["DeploymentId"]))
+            highlights = highlights_by_deployment.get(deployment["DeploymentId"], [])
 
-                    # Find any artifacts in
-                    release_details.extend(
-                        get_artifacts(deployment_highlights, octopus_url, deployment["DeploymentId"]))
+            # Find any running steps
+            release_details.extend(map(lambda x: '&ensp;' + x, get_running(highlights)))
 
-                    # Find the associated github workflow and build a link
-                    release_details.extend(get_workflow_link(release_workflow_runs, release["Release"]["Id"]))
+            release_details.append(f"⟲ {difference} ago")
 
-                    table += f"| {'<br/>'.join(release_details)}"
-            else:
-                table += "| ⨂ "
-    table += "|  "
-    return table
+            # Find any highlights in the logs
+            release_details.extend(get_highlights(highlights))
+
+            # Find any artifacts in
+            release_details.extend(get_artifacts(highlights, octopus_url))
+
+            # Find the associated github workflow and build a link
+            release_details.extend(get_workflow_link(workflow_runs_by_release.get(release["Release"]["Id"])))
+
+            table.append(f"| {'<br/>'.join(release_details)}")
+    table.append("|  ")
+    return "".join(table)
 
 
 def get_tenant_environments(tenant, dashboard, project_id):
@@ -213,10 +247,10 @@ def get_tenant_environments(tenant, dashboard, project_id):
     return environments_ids
 
 
-def get_tenant_environment_details(environments_ids, dashboard):
+def get_tenant_environment_details(environments_ids, environment_names_by_id):
     environments = []
     for environment in environments_ids:
-        environment_name = get_env_name(dashboard, environment)
+        environment_name = get_env_name(environment_names_by_id, environment)
         # Sometimes tenants will list environments that have no reference
         if environment_name:
             environments.append({"Name": environment_name, "Id": environment})
@@ -227,76 +261,114 @@ def get_tenant_environment_details(environments_ids, dashboard):
 def get_project_tenant_progression_response(space_id, space_name, project_name, project_id, dashboard,
                                             github_repo, github_actions_statuses, release_workflow_runs,
                                             pull_requests, issues, deployment_highlights, api_key, url):
-    now = datetime.now(pytz.utc)
+    now = datetime.now(timezone.utc)
+
+    table = [f"# {space_name} / {project_name}\n\n"]
 
-    table = f"# {space_name} / {project_name}\n\n"
+    repo_links = get_repo_links(github_repo)
 
     message = []
-    message.extend(build_repo_link(github_repo))
+    message.extend(build_repo_link(repo_links))
     message.extend(get_project_workflow_status(github_actions_statuses, project_id))
-    message.extend(build_pr_response(pull_requests, github_repo))
-    message.extend(build_issue_response(issues, github_repo))
+    message.extend(build_pr_response(pull_requests, repo_links))
+    message.extend(build_issue_response(issues, repo_links))
 
     if message:
-        table += '<br/>'.join(message) + "\n\n"
+        table.append('<br/>'.join(message) + "\n\n")
+
+    # Index the first deployment for each tenant and environment. Untenanted deployments have no TenantId,
+    # which matches the untenanted entry in the list of tenants that has no Id.
+    environment_names_by_id = get_environment_names_by_id(dashboard)
+
+    tenant_deployments = {}
+    for deployment in dashboard["Items"]:
+        tenant_deployments.setdefault((deployment.get("TenantId"), deployment.get("EnvironmentId")), deployment)
 
+    # Find the deployment displayed in each cell of the tenant tables
+    tenant_cells = []
     for tenant in dashboard["Tenants"]:
-        table += f"## {tenant['Name']}\n"
         environments_ids = get_tenant_environments(tenant, dashboard, project_id)
-        environments = get_tenant_environment_details(environments_ids, dashboard)
-        environment_names = list(map(lambda e: e["Name"], environments))
-        table += build_markdown_table_row(environment_names)
-        table += build_markdown_table_header_separator(len(environments))
+        environments = get_tenant_environment_details(environments_ids, environment_names_by_id)
+        cells = [(environment, tenant_deployments.get((tenant.get("Id"), environment.get("Id"))))
+                 for environment in environments]
+        tenant_cells.append((tenant, cells))
+
+    # Fetch the channels of the displayed deployments up front rather than one at a time as each cell is rendered
+    channels = get_channels({deployment["ChannelId"] for _, cells in tenant_cells for _, deployment in cells
+                             if deployment}, space_id, api_key, url)
+
+    # Index the deployment highlights and workflow runs rather than searching them for every deployment
+    highlights_by_deployment = group_by(deployment_highlights, "DeploymentId")
+    workflow_runs_by_release = group_by(release_workflow_runs, "ReleaseId")
+
+    for tenant, cells in tenant_cells:
+        table.append(f"## {tenant['Name']}\n")
+        environments = [environment for environment, _ in cells]
+        environment_names = list(map(get_name, environments))
+        table.append(build_markdown_table_row(environment_names))
+        table.append(build_markdown_table_header_separator(len(environments)))
 
         columns = []
-        for environment in environments:
-            found = False
-            for deployment in dashboard["Items"]:
-                # Note None == None, so the untenanted deployment will satisfy this condition because
-                # the tenant has no ID and neither does the deployment
-                tenanted = deployment.get("TenantId") == tenant.get("Id")
-                environment_match = deployment.get("EnvironmentId") == environment.get("Id")
-                if environment_match and tenanted:
-                    icon = get_state_icon(deployment['State'], deployment['HasWarningsOrErrors'])
-                    created = parse_unknown_format_date(deployment["Created"])
-                    difference = get_date_difference_summary(now - created)
-                    channel = get_channel_cached(space_id, deployment["ChannelId"], api_key, url)
+        for _, deployment in cells:
+            if deployment:
+                icon = get_state_icon(deployment['State'], deployment['HasWarningsOrErrors'])
+                created = parse_unknown_format_date(deployment["Created"])
+                difference = get_date_difference_summary(now - created)
+                channel = channels.get(deployment["ChannelId"]) \
+                    or get_channel_cached(space_id, deployment["ChannelId"], api_key, url)
 
-                    release_url = build_deployment_url(url, space_id, deployment['ProjectId'],
-                                                       deployment['ReleaseVersion'], deployment['DeploymentId'])
+                release_url = build_deployment_url(url, space_id, deployment['ProjectId'],
+                                                   deployment['ReleaseVersion'], deployment['DeploymentId'])
 
-                    release_details = [f"{icon} [{deployment['ReleaseVersion']}]({release_url})"]
+                release_details = [f"{icon} [{deployment['ReleaseVersion']}]({release_url})"]
 
-                    # Find any running steps
-                    release_details.extend(
-                        map(lambda x: '&ensp;' + x, get_running(deployment_highlights, deployment["DeploymentId"])))
+                highlights = highlights_by_deployment.get(deployment["DeploymentId"], [])
 
-                    release_details.extend([f"🔀 {channel['Name']}",
-                                            f"⟲ {difference} ago"])
+                # Find any running steps
+                release_details.extend(map(lambda x: '&ensp;' + x, get_running(highlights)))
 
-                    # Find any highlights in the logs
-                    release_details.extend(get_highlights(deployment_highlights, deployment["DeploymentId"]))
+                release_details.extend([f"🔀 {channel['Name']}",
+                                        f"⟲ {difference} ago"])
 
-                    # Find any artifacts in
-                    release_details.extend(get_artifacts(deployment_highlights, url, deployment["DeploymentId"]))
+                # Find any highlights in the logs
+                release_details.extend(get_highlights(highlights))
 
-                    # Find the associated github workflow and build a link
-                    release_details.extend(get_workflow_link(release_workflow_runs, deployment["ReleaseId"]))
+                # Find any artifacts in
+                release_details.extend(get_artifacts(highlights, url))
 
-                    columns.append("<br/>".join(release_details))
-                    found = True
-                    break
+                # Find the associated github workflow and build a link
+                release_details.extend(get_workflow_link(workflow_runs_by_release.get(deployment["ReleaseId"])))
 
-            if not found:
+                columns.append("<br/>".join(release_details))
+            else:
                 columns.append('⨂')
 
         if columns:
-            table += build_markdown_table_row(columns)
+            table.append(build_markdown_table_row(columns))
         else:
-            table += "\nNo deployments"
+            table.append("\nNo deployments")
+
+        table.append("\n\n")
+    return "".join(table)
+
+
+def get_channels(channel_ids, space_id, api_key, url):
+    """
+    Fetches the channels concurrently
+    :param channel_ids: The IDs of the channels to fetch
+    :param space_id: The space ID
+    :param api_key: The Octopus API key
+    :param url: The Octopus URL
+    :return: A dict mapping channel IDs to channels
+    """
+    channel_ids = list(channel_ids)
+    if not channel_ids:
+        return {}
 
-        table += "\n\n"
-    return table
+    with ThreadPoolExecutor(max_workers=min(len(channel_ids), max_concurrent_channel_requests)) as executor:
+        channels = executor.map(lambda channel_id: get_channel_cached(space_id, channel_id, api_key, url),
+                                channel_ids)
+        return dict(zip(channel_ids, channels))
 
 
 def build_runbook_run_columns(run, now, get_tenant):
@@ -308,68 +380,100 @@ def build_runbook_run_columns(run, now, get_tenant):
 
 
 def get_tenants(dashboard):
-    tenants = []
-    for environment in dashboard["RunbookRuns"]:
-        runs = dashboard["RunbookRuns"][environment]
+    # A dict removes duplicates while retaining the order the tenants were found in
+    tenants = {}
+    for runs in dashboard["RunbookRuns"].values():
         for run in runs:
-            tenant = "Untenanted" if not run['TenantId'] else run['TenantId']
-            if tenant not in tenants:
-                tenants.append(tenant)
-    return tenants
+            tenants["Untenanted" if not run['TenantId'] else run['TenantId']] = None
+    return list(tenants)
 
 
 def get_runbook_dashboard_response(project, runbook, dashboard, get_tenant):
-    dt = datetime.now(pytz.utc)
+    dt = datetime.now(timezone.utc)
 
-    table = f"{project['Name']} / {runbook['Name']}\n\n"
+    table = [f"{project['Name']} / {runbook['Name']}\n\n"]
 
     tenants = get_tenants(dashboard)
 
-    environment_ids = list(map(lambda x: x, dashboard["RunbookRuns"]))
-    environment_names = list(map(lambda e: get_env_name(dashboard, e), environment_ids))
+    environment_ids = list(dashboard["RunbookRuns"])
+    environment_names_by_id = get_environment_names_by_id(dashboard)
+    environment_names = [get_env_name(environment_names_by_id, e) for e in environment_ids]
     columns = ["", *environment_names]
-    table += build_markdown_table_row(columns)
-    table += build_markdown_table_header_separator(len(columns))
+    table.append(build_markdown_table_row(columns))
+    table.append(build_markdown_table_header_separator(len(columns)))
+
+    # Bucket the runs by tenant once rather than filtering every environment's runs for every tenant
+    runs_by_environment = {environment: {} for environment in environment_ids}
+    for environment, runs in dashboard["RunbookRuns"].items():
+        for run in runs:
+            runs_by_environment[environment].setdefault(run['TenantId'] or "Untenanted", []).append(run)
 
     # Build the execution rows
     for tenant in tenants:
         for environment in environment_ids:
-            runs = list(
-                filter(lambda run: run['TenantId'] == tenant or (not run['TenantId'] and tenant == "Untenanted"),
-                       dashboard["RunbookRuns"][environment]))
-            for run in runs:
-                table += build_markdown_table_row(build_runbook_run_columns(run, dt, get_tenant))
+            for run in runs_by_environment[environment].get(tenant, ()):
+                table.append(build_markdown_table_row(build_runbook_run_columns(run, dt, get_tenant)))
 
-    return table
+    return "".join(table)
 
 
 def build_deployment_url(octopus_url, space_id, project_id, release_version, deployment_id):
     return f"{octopus_url}/app#/{space_id}/projects/{project_id}/deployments/releases/{release_version}/deployments/{deployment_id}"
 
 
+def index_by_project(items, predicate=None):
+    """
+    Indexes a list of GitHub details by the project they are associated with
+    :param items: The items to index, each with a ProjectId
+    :param predicate: An optional function used to ignore items that can not be displayed
+    :return: A dict mapping project IDs to the first matching item
+    """
+    indexed = {}
+    for item in items or []:
+        if item and (predicate is None or predicate(item)):
+            indexed.setdefault(item["ProjectId"], item)
+    return indexed
+
+
+def group_by(items, key):
+    """
+    Groups a list of dicts by the value of a key
+    :param items: The items to group
+    :param key: The key to group by
+    :return: A dict mapping the key values to the list of matching items, in their original order
+    """
+    grouped = {}
+    for item in items or []:
+        if item:
+            grouped.setdefault(item.get(key), []).append(item)
+    return grouped
+
+
 def get_project_workflow_status(github_actions_statuses, project_id):
-    now = datetime.now(pytz.utc)
-    message = []
-    if github_actions_statuses:
-        github_actions_status = next(
-            filter(lambda x: x and x["ProjectId"] == project_id and x["Status"], github_actions_statuses), None)
+    github_actions_status = next((x for x in github_actions_statuses or []
+                                  if x and x["ProjectId"] == project_id and x["Status"]), None)
+    return build_workflow_status(github_actions_status)
 
-        if github_actions_status:
-            message.append(
-                f"{get_github_state_icon(github_actions_status.get('Status'), github_actions_status.get('Conclusion'))} "
-                + f"[{github_actions_status.get('Name')} {github_actions_status.get('ShortSha')}]({github_actions_status.get('Url')}) "
-                + f"(⟲ {get_date_difference_summary(now - github_actions_status.get('CreatedAt'))} ago)")
-
-            # Print any jobs currently running
-            if github_actions_status.get("Jobs"):
-                for job in github_actions_status.get("Jobs").get("jobs"):
-                    if job.get("status") == "in_progress":
-                        message.append("&ensp;" + build_job_status(job))
+
+def build_workflow_status(github_actions_status):
+    now = datetime.now(timezone.utc)
+    message = []
+    if github_actions_status:
+        message.append(
+            f"{get_github_state_icon(github_actions_status.get('Status'), github_actions_status.get('Conclusion'))} "
+            + f"[{github_actions_status.get('Name')} {github_actions_status.get('ShortSha')}]({github_actions_status.get('Url')}) "
+            + f"(⟲ {get_date_difference_summary(now - github_actions_status.get('CreatedAt'))} ago)")
+
+        # Print any jobs currently running
+        if github_actions_status.get("Jobs"):
+            for job in github_actions_status.get("Jobs").get("jobs"):
+                if job.get("status") == "in_progress":
+                    message.append("&ensp;" + build_job_status(job))
     return message
 
 
 def build_job_status(job):
-    now = datetime.now(pytz.utc)
+    now = datetime.now(timezone.utc)
     created = parse_unknown_format_date(job.get("started_at"))
     completed = parse_unknown_format_date(job.get("completed_at"))
     if completed and created:
@@ -381,86 +485,80 @@ def build_job_status(job):
     return f"{get_github_state_icon(job.get('status'), job.get('conclusion'))} {job.get('name')}{difference}"
 
 
-def build_pr_response_for_project(pull_requests, project_id, github_repo):
-    if not pull_requests:
-        return []
+class GitHubRepoLinks:
+    """
+    The links to a GitHub repo displayed on a dashboard. These are built once per repo rather than each time
+    a link is displayed.
+    """
 
-    status = next(filter(lambda x: x["ProjectId"] == project_id, pull_requests), None)
-    return build_pr_response(status, github_repo)
+    __slots__ = ("repo", "pulls", "issues")
 
+    def __init__(self, github_repo):
+        base_url = f"https://github.com/{github_repo.get('Owner')}/{github_repo.get('Repo')}"
+        self.repo = base_url if github_repo.get("Owner") and github_repo.get("Repo") else None
+        self.pulls = base_url + "/pulls"
+        self.issues = base_url + "/issues"
 
-def build_pr_response(pull_requests, github_repo):
-    message = []
-    if pull_requests and github_repo:
-        message.append(
-            f"🔁 [{pull_requests.get('Count')} PR{'s' if pull_requests.get('Count') != 1 else ''}](https://github.com/{github_repo['Owner']}/{github_repo['Repo']}/pulls)")
-    return message
 
+def get_repo_links(github_repo):
+    return GitHubRepoLinks(github_repo) if github_repo else None
 
-def build_issue_response_for_project(issues, project_id, github_repo):
-    if not issues:
-        return []
 
-    status = next(filter(lambda x: x["ProjectId"] == project_id, issues), None)
-    return build_issue_response(status, github_repo)
+def build_pr_response(pull_requests, repo_links):
+    message = []
+    if pull_requests and repo_links:
+        message.append(
+            f"🔁 [{pull_requests.get('Count')} PR{'s' if pull_requests.get('Count') != 1 else ''}]({repo_links.pulls})")
+    return message
 
 
-def build_issue_response(issues, github_repo):
+def build_issue_response(issues, repo_links):
     message = []
-    if issues and github_repo:
+    if issues and repo_links:
         message.append(
-            f"🐛 [{issues.get('Count')} issue{'s' if issues.get('Count') != 1 else ''}](https://github.com/{github_repo['Owner']}/{github_repo['Repo']}/issues)")
+            f"🐛 [{issues.get('Count')} issue{'s' if issues.get('Count') != 1 else ''}]({repo_links.issues})")
     return message
 
 
-def build_repo_link(github_repo):
+def build_repo_link(repo_links):
     message = []
-    if github_repo and github_repo.get("Owner") and github_repo.get("Repo"):
-        message.append(f'📑 [GitHub Repo](https://github.com/{github_repo["Owner"]}/{github_repo["Repo"]})')
+    if repo_links and repo_links.repo:
+        message.append(f'📑 [GitHub Repo]({repo_links.repo})')
     return message
 
 
-def get_workflow_link(release_workflow_runs, release_id):
-    matching_releases = yield_first(filter(
-        lambda x: x and x.get("ReleaseId") == release_id,
-        release_workflow_runs or []))
+def get_workflow_link(release_workflow_runs):
+    """
+    Builds the links to the first workflow run associated with a release
+    :param release_workflow_runs: The workflow runs associated with a release
+    :return: The list of links to display
+    """
+    release = next(iter(release_workflow_runs or []), None)
+    if not release:
+        return []
 
-    messages = []
-    for release in matching_releases:
-        messages.append(
-            f"{get_github_state_icon(release.get('Status'), release.get('Conclusion'))} "
-            + f"[{release.get('Name')} {release.get('ShortSha')}]({release.get('Url')})")
+    messages = [f"{get_github_state_icon(release.get('Status'), release.get('Conclusion'))} "
+                + f"[{release.get('Name')} {release.get('ShortSha')}]({release.get('Url')})"]
 
-        for artifact in release.get("Artifacts", [])[:max_github_artifacts]:
-            messages.append(f"💾 [{artifact.get('Name')}]({artifact.get('Url')})")
+    for artifact in release.get("Artifacts", [])[:max_github_artifacts]:
+        messages.append(f"💾 [{artifact.get('Name')}]({artifact.get('Url')})")
 
     return messages
 
 
 def get_artifact_links(release_workflow_artifacts, release_id):
-    matching_artifacts = list(filter(
-        lambda x: x and x.get("ReleaseId") == release_id,
-        release_workflow_artifacts or []))
-
-    return list(map(
-        lambda x: f"💾 [{x.get('Name')}]({x.get('Url')})",
-        matching_artifacts))
+    return [f"💾 [{x.get('Name')}]({x.get('Url')})" for x in release_workflow_artifacts or []
+            if x and x.get("ReleaseId") == release_id]
 
 
-def get_highlights(deployment_highlights, deployment_id):
-    return list(map(lambda x: x['Highlights'],
-                    filter(lambda x: x and x["DeploymentId"] == deployment_id and x['Highlights'],
-                           deployment_highlights or [])))
+def get_highlights(deployment_highlights):
+    return [x['Highlights'] for x in deployment_highlights if x['Highlights']]
 
 
-def get_running(deployment_highlights, deployment_id):
-    return flatten_list(list(map(lambda x: x['Running'],
-                                 filter(lambda x: x and x["DeploymentId"] == deployment_id,
-                                        deployment_highlights or []))))
+def get_running(deployment_highlights):
+    return flatten_list([x['Running'] for x in deployment_highlights])
 
 
-def get_artifacts(deployment_highlights, url, deployment_id):
-    artifacts = flatten_list(list(map(lambda x: x['Artifacts']['Items'],
-                                      filter(lambda x: x and x["DeploymentId"] == deployment_id,
-                                             deployment_highlights or []))))
-    return list(map(lambda a: f"💾 [{a['Filename']}]({url}{a['Links']['Content']})", artifacts))
+def get_artifacts(deployment_highlights, url):
+    artifacts = flatten_list([x['Artifacts']['Items'] for x in deployment_highlights])
+    return [f"💾 [{a['Filename']}]({url}{a['Links']['Content']})" for a in artifacts]
@@ -1,84 +1,61 @@
-def get_github_state_icon(status, conclusion):
-    # https://github.com/github/rest-api-description/issues/1634
-    # Value of the status property can be one of: “queued”, “in_progress”, or “completed”.
-    # When it’s “completed,” it makes sense to check if it finished successfully.
-    # We need a value of the conclusion property.
-    # Can be one of the “success”, “failure”, “neutral”, “cancelled”, “skipped”, “timed_out”, or “action_required”.
-
-    if status == "in_progress":
-        return "🔵"
-
-    elif status == "queued":
-        return "🟣"
-
-    # status of completed is assumed from this point down, and we're displaying the conclusion
-
-    if conclusion == "success":
-        return "🟢"
-
-    elif conclusion == "failure" or conclusion == "timed_out":
-        return "🔴"
+# https://github.com/github/rest-api-description/issues/1634
+# Value of the status property can be one of: “queued”, “in_progress”, or “completed”.
+# When it’s “completed,” it makes sense to check if it finished successfully.
+# We need a value of the conclusion property.
+# Can be one of the “success”, “failure”, “neutral”, “cancelled”, “skipped”, “timed_out”, or “action_required”.
+github_status_icons = {
+    "in_progress": "🔵",
+    "queued": "🟣",
+}
+
+github_conclusion_icons = {
+    "success": "🟢",
+    "failure": "🔴",
+    "timed_out": "🔴",
+    "action_required": "🟠",
+    "cancelled": "⚪",
+    "neutral": "⚪",
+    "skipped": "⚪",
+}
+
+# Octopus task states, keyed by the state and whether the task had warnings or errors
+state_icons = {
+    ("Executing", False): "🔵",
+    ("Executing", True): "🔵",
+    ("Success", False): "🟢",
+    ("Success", True): "🟡",
+    ("Failed", False): "🔴",
+    ("Failed", True): "🔴",
+    ("Canceled", False): "⚪",
+    ("Canceled", True): "⚪",
+    ("TimedOut", False): "🔴",
+    ("TimedOut", True): "🔴",
+    ("Cancelling", False): "🔴",
+    ("Cancelling", True): "🔴",
+    ("Queued", False): "🟣",
+    ("Queued", True): "🟣",
+}
+
+activity_log_state_icons = {
+    "Running": "🔵",
+    "SuccessWithWarning": "🟡",
+    "Success": "🟢",
+    "Failed": "🔴",
+    "Canceled": "⚪",
+    "TimedOut": "🔴",
+    "Cancelling": "🔴",
+    "Queued": "🟣",
+}
 
-    elif conclusion == "action_required":
-        return "🟠"
 
-    elif conclusion == "cancelled" or conclusion == "neutral" or conclusion == "skipped":
-        return "⚪"
-
-    return "⚪"
+def get_github_state_icon(status, conclusion):
+    # status of completed is assumed if the status has no icon, and we're displaying the conclusion
+    return github_status_icons.get(status) or github_conclusion_icons.get(conclusion, "⚪")
 
 
 def get_state_icon(state, has_warnings):
-    if state == "Executing":
-        return "🔵"
-
-    if state == "Success":
-        if has_warnings:
-            return "🟡"
-        else:
-            return "🟢"
-
-    elif state == "Failed":
-        return "🔴"
-
-    if state == "Canceled":
-        return "⚪"
-
-    elif state == "TimedOut":
-        return "🔴"
-
-    elif state == "Cancelling":
-        return "🔴"
-
-    elif state == "Queued":
-        return "🟣"
-
-    return "⚪"
+    return state_icons.get((state, bool(has_warnings)), "⚪")
 
 
 def get_activity_log_state_icon(state):
-    if state == "Running":
-        return "🔵"
-
-    if state == "SuccessWithWarning":
-        return "🟡"
-
-    if state == "Success":
-        return "🟢"
-
-    elif state == "Failed":
-        return "🔴"
-
-    if state == "Canceled":
-        return "⚪"
-
-    elif state == "TimedOut":
-        return "🔴"
-
-    elif state == "Cancelling":
-        return "🔴"
-
-    elif state == "Queued":
-        return "🟣"
-
-    return "⚪"
+    return activity_log_state_icons.get(state, "⚪")
@@ -8,6 +8,7 @@ from domain.config.octopus import min_octopus_version
 from domain.context.github_docs import get_docs_context
 from domain.context.octopus_context import llm_message_query
 from domain.errors.error_handling import handle_error
+from domain.exceptions.circuit_open import CircuitOpen
 from domain.exceptions.not_authorized import NotAuthorized
 from domain.exceptions.openai_error import OpenAIContentFilter, OpenAITokenLengthExceeded
 from domain.exceptions.request_failed import GitHubRequestFailed, OctopusRequestFailed
@@ -413,6 +414,8 @@ def submit_query(req: func.HttpRequest) -> func.HttpResponse:
     except OpenAIContentFilter as e:
         handle_error(e)
         return func.HttpResponse(NO_FUNCTION_RESPONSE, status_code=400)
+    except CircuitOpen as e:
+        return handle_circuit_open(e)
     except OpenAITokenLengthExceeded as e:
         handle_error(e)
         return func.HttpResponse(
@@ -452,6 +455,8 @@ def copilot_handler_internal(req: func.HttpRequest) -> func.HttpResponse:
 
     except UserNotLoggedIn as e:
         return handle_user_not_logged_in(e)
+    except CircuitOpen as e:
+        return handle_circuit_open(e)
     except OctopusRequestFailed as e:
         return handle_octopus_request_failed(e)
     except GitHubRequestFailed as e:
@@ -519,6 +524,13 @@ def handle_user_not_logged_in(e):
                              headers=get_sse_headers())
 
 
+def handle_circuit_open(e):
+    # The failures that opened the circuit have already been logged, so this is not reported again
+    return func.HttpResponse(convert_to_sse_response(
+        "The service is temporarily unavailable because recent requests have failed. Please try again shortly."),
+        headers=get_sse_headers())
+
+
 def handle_octopus_request_failed(e):
     handle_error(e)
     return func.HttpResponse(convert_to_sse_response(
@@ -0,0 +1,118 @@
+import time
+from collections import OrderedDict
+from threading import Lock
+from urllib.parse import urlparse
+
+from domain.config.circuit import max_circuit_breakers
+from domain.exceptions.circuit_open import CircuitOpen
+
+# The states of a circuit breaker
+circuit_closed = "closed"
+circuit_open = "open"
+circuit_half_open = "half_open"
+
+# Circuit breakers keyed by host and an optional scope, so a failing service does not block requests to other services.
+# The breakers are ordered from least to most recently used, so the oldest can be discarded.
+circuit_breakers = OrderedDict()
+circuit_breakers_lock = Lock()
+
+
+class CircuitBreaker:
+    """
+    Fails requests to a host immediately once a number of consecutive requests have failed. After the recovery
+    time has passed, a single request is allowed through to test if the host has recovered.
+    """
+
+    def __init__(self, host, threshold=5, recovery=30):
+        """
+        :param host: The host the requests are sent to
+        :param threshold: The number of consecutive failures that open the circuit
+        :param recovery: The number of seconds to wait before testing the host again
+        """
+        self.host = host
+        self.threshold = threshold
+        self.recovery = recovery
+        self.failures = 0
+        self.opened_at = None
+        self.state = circuit_closed
+        self.lock = Lock()
+
+    def call(self, callback, is_failure=None):
+        """
+        Calls the callback if the circuit allows it
+        :param callback: The function making the request
+        :param is_failure: An optional function that determines if a result returned by the callback is a failure
+        :return: The result of the callback
+        """
+        self.before_call()
+
+        try:
+            result = callback()
+        except BaseException:
+            # Any interruption is recorded as a failure, so a half open circuit is never left waiting for a result
+            self.record_failure()
+            raise
+
+        if is_failure and is_failure(result):
+            self.record_failure()
+        else:
+            self.record_success()
+
+        return result
+
+    def before_call(self):
+        with self.lock:
+            if self.state == circuit_closed:
+                return
+
+            # Only one request tests the host when the recovery time has passed
+            if self.state == circuit_open and time.monotonic() - self.opened_at >= self.recovery:
+                self.state = circuit_half_open
+                return
+
+            raise CircuitOpen(self.host)
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.state == circuit_half_open or self.failures >= self.threshold:
+                self.state = circuit_open
+                self.opened_at = time.monotonic()
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.state = circuit_closed
+
+
+def get_circuit_breaker(url, scope=None):
+    """
+    Returns the circuit breaker shared by all requests to the host of the URL
+    :param url: The URL being requested
+    :param scope: An optional value that splits the requests to the host into independent circuits. This is used
+    when the host proxies requests to another server, so one failing downstream server does not block the others.
+    :return: The circuit breaker for the host and scope
+    """
+    host = urlparse(url).netloc
+    key = (host, scope)
+
+    with circuit_breakers_lock:
+        breaker = circuit_breakers.get(key)
+        if breaker is None:
+            breaker = circuit_breakers[key] = CircuitBreaker(host)
+            while len(circuit_breakers) > max_circuit_breakers:
+                circuit_breakers.popitem(last=False)
+        else:
+            circuit_breakers.move_to_end(key)
+
+        return breaker
+
+
+def is_server_error(response):
+    """
+    Determines if a response indicates the server is failing, as opposed to the request being invalid
+    :param response: The response to inspect
+    :return: True if the response indicates a server failure, and False otherwise
+    """
+    return response.status >= 500
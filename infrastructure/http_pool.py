@@ -1,4 +1,11 @@
 import urllib3
 
 TAKE_ALL = 10000
-http = urllib3.PoolManager()
+
+# The number of hosts (Octopus instances, octoterra, Slack, GitHub etc.) whose connections are kept open
+max_pools = 32
+# The number of connections kept alive for each host. Requests over this limit still proceed, but their
+# connections are discarded rather than returned to the pool.
+max_connections_per_pool = 64
+
+http = urllib3.PoolManager(num_pools=max_pools, maxsize=max_connections_per_pool, block=False)
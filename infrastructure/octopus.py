@@ -1,15 +1,18 @@
 import asyncio
 import datetime
+import hashlib
 import json
 import re
 from urllib.parse import urlparse
 
 import aiohttp
 import pytz
+from expiring_dict import ExpiringDict
 from fuzzywuzzy import fuzz
 from retry import retry
 from urllib3.exceptions import HTTPError
 
+from domain.config.octopus import space_id_cache_ttl
 from domain.config.openai import max_context
 from domain.converters.string_to_int import string_to_int
 from domain.exceptions.request_failed import OctopusRequestFailed
@@ -29,6 +32,9 @@ logger = configure_logging()
 channel_cache = {}
 tenant_cache = {}
 environment_cache = {}
+# Space names rarely change, so the IDs they resolve to are cached for a short time.
+# The cache is keyed on a hash of the API key to ensure one user can not see a space only another user has access to.
+space_id_cache = ExpiringDict(space_id_cache_ttl)
 
 # Semaphore to limit the number of concurrent requests to GitHub
 sem = asyncio.Semaphore(10)
@@ -108,6 +114,24 @@ def get_space_id_and_name_from_name(space_name, my_api_key, my_octopus_api):
                             'my_octopus_api must be the Octopus Url (get_space_id_and_name_from_name).')
     ensure_string_not_empty(my_api_key, 'my_api_key must be the Octopus Api key (get_space_id_and_name_from_name).')
 
+    cache_key = (my_octopus_api, hashlib.sha256(my_api_key.encode("utf-8")).hexdigest(), space_name)
+    space = space_id_cache.get(cache_key)
+
+    if not space:
+        space = space_id_cache[cache_key] = lookup_space_id_and_name(space_name, my_api_key, my_octopus_api)
+
+    return space
+
+
+def lookup_space_id_and_name(space_name, my_api_key, my_octopus_api):
+    """
+    Finds a space ID and actual space name from the Octopus API
+    :param space_name: The name or id of the space
+    :param my_octopus_api: The Octopus URL
+    :param my_api_key: The Octopus API key
+    :return: The space ID and actual name
+    """
+
     # Early exit if an ID was supplied
     if space_name.startswith("Spaces-"):
         space = get_space(space_name, my_api_key, my_octopus_api)
@@ -1327,16 +1351,13 @@ def get_channel(space_id, channel_id, api_key, octopus_url):
 
 @logging_wrapper
 def get_channel_cached(space_id, channel_id, api_key, octopus_url):
-    if not channel_cache.get(octopus_url):
-        channel_cache[octopus_url] = {}
-
-    if not channel_cache[octopus_url].get(space_id):
-        channel_cache[octopus_url][space_id] = {}
+    # setdefault is atomic, so channels can be fetched from multiple threads without losing cache entries
+    space_channels = channel_cache.setdefault(octopus_url, {}).setdefault(space_id, {})
 
-    if not channel_cache[octopus_url][space_id].get(channel_id):
-        channel_cache[octopus_url][space_id][channel_id] = get_channel(space_id, channel_id, api_key, octopus_url)
+    if not space_channels.get(channel_id):
+        space_channels[channel_id] = get_channel(space_id, channel_id, api_key, octopus_url)
 
-    return channel_cache[octopus_url][space_id][channel_id]
+    return space_channels[channel_id]
 
 
 @retry(HTTPError, tries=3, delay=2)
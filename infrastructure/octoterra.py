@@ -1,9 +1,9 @@
-import json
-import os
+from functools import lru_cache
 
-from retry import retry
-from urllib3.exceptions import HTTPError
+import orjson
+from urllib3 import Retry, Timeout
 
+from domain.config.octoterra import get_octoterra_url, octoterra_body_cache_size
 from domain.config.openai import max_context
 from domain.logging.app_logging import configure_logging
 from domain.performance.timing import timing_wrapper
@@ -17,13 +17,44 @@ from domain.sanitizers.sanitized_list import sanitize_projects, sanitize_tenants
     sanitize_certificates, sanitize_lifecycles, sanitize_workerpools, sanitize_machinepolicies, sanitize_tenanttagsets, \
     sanitize_projectgroups, none_if_falesy, sanitize_steps, none_if_falesy_or_all, sanitize_variables
 from domain.validation.argument_validation import ensure_string_not_empty
+from infrastructure.circuit import get_circuit_breaker, is_server_error
 from infrastructure.http_pool import http
 from infrastructure.octopus import handle_response, logging_wrapper
 
 logger = configure_logging(__name__)
 
+# Octoterra requests are retried with an exponential backoff and jitter, but only for connection errors, timeouts,
+# and responses indicating a transient failure. Other responses, like an invalid API key, fail immediately.
+octoterra_retries = Retry(total=2, allowed_methods=None, status_forcelist=(429, 500, 502, 503, 504),
+                          backoff_factor=2, backoff_jitter=1, backoff_max=30, raise_on_status=False)
+
+# Exporting a large space can take some time, so the read timeout is generous. It still ensures a hung
+# request does not block the caller indefinitely.
+octoterra_timeout = Timeout(connect=5, read=120)
+
+
+# The settings sent with every octoterra request
+octoterra_body_defaults = {
+    "ignoreCacManagedValues": False,
+    "excludeCaCProjectSettings": True,
+    "limitAttributeLength": 100,
+    # This setting ensures that any project, tenant, runbook, or target names are valid.
+    # If not, the assumption is made that the LLM incorrectly identified the resource in the query,
+    # and the results must not be limited by that incorrect assumption.
+    "ignoreInvalidExcludeExcept": True,
+    "excludeTerraformVariables": True,
+    "excludeSpaceCreation": True,
+    "excludeProvider": True,
+    "includeIds": True,
+    "includeSpaceInPopulation": True,
+    # Limit the number of resources to prevent the context from filling up and the LLM from
+    # having to process more items than it can reasonably process.
+    "limitResourceCount": max_context,
+    # Include the default channel as a standard resource rather than a data lookup
+    "includeDefaultChannel": True,
+}
+
 
-@retry(HTTPError, tries=3, delay=2)
 @logging_wrapper
 def get_octoterra_space(query, space_id, project_names, runbook_names, target_names, tenant_names,
                         library_variable_sets, environment_names, feed_names, account_names, certificate_names,
@@ -43,24 +74,90 @@ def get_octoterra_space(query, space_id, project_names, runbook_names, target_na
     ensure_string_not_empty(api_key, 'api_key must be a non-empty string (get_octoterra_space).')
     ensure_string_not_empty(octopus_url, 'octopus_url must be a non-empty string (get_octoterra_space).')
 
+    body, include_all_resources = build_octoterra_body(query, space_id,
+                                                       freeze_names(project_names),
+                                                       freeze_names(runbook_names),
+                                                       freeze_names(target_names),
+                                                       freeze_names(tenant_names),
+                                                       freeze_names(library_variable_sets),
+                                                       freeze_names(environment_names),
+                                                       freeze_names(feed_names),
+                                                       freeze_names(account_names),
+                                                       freeze_names(certificate_names),
+                                                       freeze_names(lifecycle_names),
+                                                       freeze_names(workerpool_names),
+                                                       freeze_names(machinepolicy_names),
+                                                       freeze_names(tagset_names),
+                                                       freeze_names(projectgroup_names),
+                                                       freeze_names(step_names),
+                                                       freeze_names(variable_names))
+
+    headers = {
+        "X-Octopus-ApiKey": api_key,
+        "X-Octopus-Url": octopus_url
+    }
+
+    answer = timing_wrapper(lambda: export_space(body, headers), "octoterra")
+
+    return answer, list(include_all_resources)
+
+
+def export_space(body, headers):
+    """
+    Sends the export request to octoterra
+    :param body: The serialized request body
+    :param headers: The request headers
+    :return: The space terraform module
+    """
+    url = get_octoterra_url()
+
+    # Fail fast when octoterra is down rather than having every request wait for the retries to be exhausted.
+    # Octoterra reports errors from the Octopus server it exports, so the circuit is scoped to that server to
+    # prevent one failing Octopus instance from blocking the exports of every other instance.
+    resp = handle_response(lambda: get_circuit_breaker(url, headers["X-Octopus-Url"]).call(
+        lambda: http.request("POST",
+                             url,
+                             body=body,
+                             headers=headers,
+                             retries=octoterra_retries,
+                             timeout=octoterra_timeout),
+        is_server_error))
+
+    return resp.data.decode("utf-8")
+
+
+@lru_cache(maxsize=octoterra_body_cache_size)
+def build_octoterra_body(query, space_id, project_names, runbook_names, target_names, tenant_names,
+                         library_variable_sets, environment_names, feed_names, account_names, certificate_names,
+                         lifecycle_names, workerpool_names, machinepolicy_names, tagset_names, projectgroup_names,
+                         step_names, variable_names):
+    """
+    Builds the request body sent to octoterra. The body only depends on the query and the resource names, so
+    it is cached to avoid sanitizing and inspecting the same LLM tool call repeatedly.
+    :param query: The user's query
+    :param space_id: The ID of the space.
+    :param project_names: The names of the projects to limit the export to, frozen with freeze_names.
+    :return: The serialized request body, and a tuple of the resources that are all included in the context
+    """
+
     # We want to restrict the size of the exported Terraform configuration as much as possible,
     # so we make heavy use of the options to exclude resources unless they were mentioned in the query.
-    sanitized_project_names = sanitize_projects(project_names)
-    sanitized_tenant_names = sanitize_tenants(tenant_names)
-    sanitized_target_names = sanitize_targets(target_names)
-    sanitized_runbook_names = sanitize_runbooks(runbook_names)
-    sanitized_library_variable_sets = sanitize_library_variable_sets(library_variable_sets)
-    sanitized_environments = sanitize_environments(query, environment_names)
-    sanitized_feeds = sanitize_feeds(feed_names)
-    sanitized_accounts = sanitize_accounts(account_names)
-    sanitized_certificates = sanitize_certificates(certificate_names)
-    sanitized_lifecycles = sanitize_lifecycles(lifecycle_names)
-    sanitized_workerpools = sanitize_workerpools(workerpool_names)
-    sanitized_machinepolicies = sanitize_machinepolicies(machinepolicy_names)
-    sanitized_tagsets = sanitize_tenanttagsets(tagset_names)
-    sanitized_projectgroups = sanitize_projectgroups(projectgroup_names)
-    sanitized_step_names = sanitize_steps(step_names)
-    sanitized_variable_names = sanitize_variables(variable_names)
+    sanitized_project_names = sanitize_projects(thaw_names(project_names))
+    sanitized_tenant_names = sanitize_tenants(thaw_names(tenant_names))
+    sanitized_target_names = sanitize_targets(thaw_names(target_names))
+    sanitized_runbook_names = sanitize_runbooks(thaw_names(runbook_names))
+    sanitized_library_variable_sets = sanitize_library_variable_sets(thaw_names(library_variable_sets))
+    sanitized_environments = sanitize_environments(query, thaw_names(environment_names))
+    sanitized_feeds = sanitize_feeds(thaw_names(feed_names))
+    sanitized_accounts = sanitize_accounts(thaw_names(account_names))
+    sanitized_certificates = sanitize_certificates(thaw_names(certificate_names))
+    sanitized_lifecycles = sanitize_lifecycles(thaw_names(lifecycle_names))
+    sanitized_workerpools = sanitize_workerpools(thaw_names(workerpool_names))
+    sanitized_machinepolicies = sanitize_machinepolicies(thaw_names(machinepolicy_names))
+    sanitized_tagsets = sanitize_tenanttagsets(thaw_names(tagset_names))
+    sanitized_projectgroups = sanitize_projectgroups(thaw_names(projectgroup_names))
+    sanitized_step_names = sanitize_steps(thaw_names(step_names))
+    sanitized_variable_names = sanitize_variables(thaw_names(variable_names))
 
     exclude_targets_with_no_environments = len(sanitized_environments) != 0
 
@@ -124,9 +221,8 @@ def get_octoterra_space(query, space_id, project_names, runbook_names, target_na
     include_all_resources += resources
 
     body = {
+        **octoterra_body_defaults,
         "space": space_id,
-        "ignoreCacManagedValues": False,
-        "excludeCaCProjectSettings": True,
         "excludeProjectsExcept": exclude_projects_except,
         "excludeTenantsExcept": exclude_tenants_except,
         "excludeTargetsExcept": exclude_targets_except,
@@ -158,39 +254,34 @@ def get_octoterra_space(query, space_id, project_names, runbook_names, target_na
         "excludeAllSteps": exclude_all_steps(query, sanitized_step_names),
         "excludeAllProjectVariables": exclude_all_projectvariables_value,
         "excludeProjectVariablesExcept": exclude_projectvariables_except,
-        "limitAttributeLength": 100,
-        # This setting ensures that any project, tenant, runbook, or target names are valid.
-        # If not, the assumption is made that the LLM incorrectly identified the resource in the query,
-        # and the results must not be limited by that incorrect assumption.
-        "ignoreInvalidExcludeExcept": True,
-        "excludeTerraformVariables": True,
-        "excludeSpaceCreation": True,
-        "excludeProvider": True,
-        "includeIds": True,
-        "includeSpaceInPopulation": True,
         # If any environments were mentioned, exclude targets that are not linked to the named environments.
         "excludeTargetsWithNoEnvironments": exclude_targets_with_no_environments,
-        # Limit the number of resources to prevent the context from filling up and the LLM from
-        # having to process more items than it can reasonably process.
-        "limitResourceCount": max_context,
-        # Include the default channel as a standard resource rather than a data lookup
-        "includeDefaultChannel": True,
     }
 
-    headers = {
-        "X-Octopus-ApiKey": api_key,
-        "X-Octopus-Url": octopus_url
-    }
+    return orjson.dumps(body), tuple(include_all_resources)
+
 
-    resp = timing_wrapper(lambda: handle_response(lambda: http.request("POST",
-                                                                       os.environ[
-                                                                           "APPLICATION_OCTOTERRA_URL"] + "/api/octoterra",
-                                                                       body=json.dumps(body),
-                                                                       headers=headers)), "octoterra")
+def freeze_names(names):
+    """
+    Converts the resource names supplied by the LLM into a hashable value that can be used as a cache key.
+    The sanitizers ignore anything that is not a string or a list of strings, so nothing else is retained.
+    :param names: The resource names supplied by the LLM
+    :return: A tuple of strings, a string, or None
+    """
+    if isinstance(names, list):
+        return tuple(name for name in names if isinstance(name, str))
+    if isinstance(names, str):
+        return names
+    return None
 
-    answer = resp.data.decode("utf-8")
 
-    return answer, include_all_resources
+def thaw_names(names):
+    """
+    Reverses freeze_names, returning the resource names in the form the sanitizers expect
+    :param names: The value returned by freeze_names
+    :return: A list of strings, a string, or None
+    """
+    return list(names) if isinstance(names, tuple) else names
 
 
 def includes_all_projects(query, sanitized_project_names):
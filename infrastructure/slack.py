@@ -1,28 +1,107 @@
-import json
+import queue
 import traceback
+from threading import Lock, Thread
 
+import orjson
+
+from domain.config.slack import max_queued_slack_messages
+from domain.exceptions.circuit_open import CircuitOpen
 from domain.logging.app_logging import configure_logging
 from domain.validation.argument_validation import ensure_string_not_empty
+from infrastructure.circuit import get_circuit_breaker, is_server_error
 from infrastructure.http_pool import http
 
 logger = configure_logging(__name__)
 
+# Slack messages are only used for logging, so they are sent by a background worker rather than making
+# the caller wait for the webhook request to complete.
+slack_queue = queue.Queue(maxsize=max_queued_slack_messages)
+
+# The background worker is started by the first message rather than when the module is imported
+slack_worker = None
+slack_worker_lock = Lock()
+
 
 def send_slack_message(message, slack_url):
     """
-    Sends a message to a slack channel
+    Queues a message to be sent to a slack channel
     :param message: The message to send
     :param slack_url: The slack URL
     """
 
     ensure_string_not_empty(slack_url, "slack_url must be the Slack webhook Url (send_slack_message).")
 
+    start_slack_worker()
+
+    while True:
+        try:
+            slack_queue.put_nowait((message, slack_url))
+            return
+        except queue.Full:
+            logger.warning("The Slack message queue is full. The oldest message was dropped.")
+
+        # Drop the oldest message to make room for the new one
+        try:
+            slack_queue.get_nowait()
+            slack_queue.task_done()
+        except queue.Empty:
+            pass
+
+
+def start_slack_worker():
+    """
+    Starts the background thread that sends the queued slack messages, if it has not already been started
+    """
+    global slack_worker
+
+    with slack_worker_lock:
+        if slack_worker is None:
+            slack_worker = Thread(target=send_queued_slack_messages, name="slack", daemon=True)
+            slack_worker.start()
+
+
+def send_queued_slack_messages():
+    """
+    Sends the queued slack messages. This function runs forever in a background thread.
+    """
+    while True:
+        try:
+            send_next_slack_message()
+        except Exception as e:
+            # Keep the worker running, as it is not restarted and any later messages would never be sent
+            logger.error(getattr(e, 'message', repr(e)))
+            logger.error(traceback.format_exc())
+
+
+def send_next_slack_message():
+    """
+    Waits for the next queued slack message and sends it
+    """
+    message, slack_url = slack_queue.get()
+    try:
+        post_slack_message(message, slack_url)
+    finally:
+        slack_queue.task_done()
+
+
+def post_slack_message(message, slack_url):
+    """
+    Sends a message to a slack channel
+    :param message: The message to send
+    :param slack_url: The slack URL
+    """
+
     try:
-        data = json.dumps({"text": message})
-        resp = http.request("POST", slack_url, headers={'Content-Type': 'application/json'}, body=data)
+        data = orjson.dumps({"text": message})
+        resp = get_circuit_breaker(slack_url).call(
+            lambda: http.request("POST", slack_url, headers={'Content-Type': 'application/json'}, body=data),
+            is_server_error)
 
         if resp.status != 200:
             logger.error(resp.data)
+    except CircuitOpen as e:
+        # Slack is unavailable, so the message is dropped without the noise of a stack trace
+        logger.warning(str(e))
     except Exception as e:
         error_message = getattr(e, 'message', repr(e))
         logger.error(error_message)
@@ -1,4 +1,3 @@
-import json
 import os
 import time
 import unittest
@@ -7,8 +6,6 @@ from datetime import datetime
 from openai import RateLimitError
 from requests.exceptions import HTTPError
 from retry import retry
-from testcontainers.core.container import DockerContainer
-from testcontainers.core.waiting_utils import wait_for_logs
 
 from domain.transformers.sse_transformers import convert_from_sse_response
 from function_app import copilot_handler_internal, health_internal
@@ -16,7 +13,7 @@ from infrastructure.users import save_users_octopus_url_from_login, delete_defau
 from tests.application.copilot_chat_test import build_request
 from tests.infrastructure.create_and_deploy_release import create_and_deploy_release, wait_for_task
 from tests.infrastructure.octopus_config import Octopus_Api_Key, Octopus_Url
-from tests.infrastructure.octopus_infrastructure_test import run_terraform
+from tests.infrastructure.start_octopus import start_octopus
 
 
 class CopilotChatNoDefaultsTest(unittest.TestCase):
@@ -45,45 +42,9 @@ class CopilotChatNoDefaultsTest(unittest.TestCase):
             return
 
         try:
-            cls.mssql = DockerContainer("mcr.microsoft.com/mssql/server:2022-latest").with_env(
-                "ACCEPT_EULA", "True").with_env("SA_PASSWORD", "Password01!")
-            cls.mssql.start()
-            wait_for_logs(cls.mssql, "SQL Server is now ready for client connections")
-
-            mssql_ip = cls.mssql.get_docker_client().bridge_ip(cls.mssql.get_wrapped_container().id)
-
-            cls.octopus = DockerContainer("octopusdeploy/octopusdeploy").with_bind_ports(8080, 8080).with_env(
-                "ACCEPT_EULA", "Y").with_env("DB_CONNECTION_STRING",
-                                             "Server=" + mssql_ip + ",1433;Database=OctopusDeploy;User=sa;Password=Password01!").with_env(
-                "ADMIN_API_KEY", Octopus_Api_Key).with_env("DISABLE_DIND", "Y").with_env(
-                "ADMIN_USERNAME", "admin").with_env("ADMIN_PASSWORD", "Password01!").with_env(
-                "OCTOPUS_SERVER_BASE64_LICENSE", os.environ["LICENSE"]).with_env("ENABLE_USAGE", "N")
-            cls.octopus.start()
-            wait_for_logs(cls.octopus, "Web server is ready to process requests", timeout=300)
-
-            output = run_terraform("../terraform/simple/space_creation", Octopus_Url, Octopus_Api_Key)
-            run_terraform("../terraform/simple/space_population", Octopus_Url, Octopus_Api_Key,
-                          json.loads(output)["octopus_space_id"]["value"])
-            run_terraform("../terraform/empty/space_creation", Octopus_Url, Octopus_Api_Key)
+            start_octopus()
         except Exception as e:
             print(e)
-            cls.tearDownClass()
-
-    @classmethod
-    def tearDownClass(cls):
-        try:
-            cls.octopus.stop()
-        except Exception as e:
-            pass
-        finally:
-            cls.octopus = None
-
-        try:
-            cls.mssql.stop()
-        except Exception as e:
-            pass
-        finally:
-            cls.mssql = None
 
     def test_health(self):
         health_internal()
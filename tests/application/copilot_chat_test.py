@@ -10,8 +10,6 @@ import azure.functions as func
 from openai import RateLimitError
 from requests.exceptions import HTTPError
 from retry import retry
-from testcontainers.core.container import DockerContainer
-from testcontainers.core.waiting_utils import wait_for_logs
 
 from domain.lookup.octopus_lookups import lookup_space, lookup_projects, lookup_environments, lookup_tenants, \
     lookup_runbooks
@@ -22,8 +20,8 @@ from infrastructure.octopus import run_published_runbook_fuzzy, get_space_id_and
 from infrastructure.users import save_users_octopus_url_from_login, save_default_values
 from tests.infrastructure.create_and_deploy_release import create_and_deploy_release, wait_for_task
 from tests.infrastructure.octopus_config import Octopus_Api_Key, Octopus_Url
-from tests.infrastructure.octopus_infrastructure_test import run_terraform
 from tests.infrastructure.publish_runbook import publish_runbook
+from tests.infrastructure.start_octopus import start_octopus
 
 
 class CopilotChatTest(unittest.TestCase):
@@ -71,48 +69,12 @@ class CopilotChatTest(unittest.TestCase):
             return
 
         try:
-            cls.mssql = DockerContainer("mcr.microsoft.com/mssql/server:2022-latest").with_env(
-                "ACCEPT_EULA", "True").with_env("SA_PASSWORD", "Password01!")
-            cls.mssql.start()
-            wait_for_logs(cls.mssql, "SQL Server is now ready for client connections")
-
-            mssql_ip = cls.mssql.get_docker_client().bridge_ip(cls.mssql.get_wrapped_container().id)
-
-            cls.octopus = DockerContainer("octopusdeploy/octopusdeploy").with_bind_ports(8080, 8080).with_env(
-                "ACCEPT_EULA", "Y").with_env("DB_CONNECTION_STRING",
-                                             "Server=" + mssql_ip + ",1433;Database=OctopusDeploy;User=sa;Password=Password01!").with_env(
-                "ADMIN_API_KEY", Octopus_Api_Key).with_env("DISABLE_DIND", "Y").with_env(
-                "ADMIN_USERNAME", "admin").with_env("ADMIN_PASSWORD", "Password01!").with_env(
-                "OCTOPUS_SERVER_BASE64_LICENSE", os.environ["LICENSE"]).with_env("ENABLE_USAGE", "N")
-            cls.octopus.start()
-            wait_for_logs(cls.octopus, "Web server is ready to process requests", timeout=300)
-
-            output = run_terraform("../terraform/simple/space_creation", Octopus_Url, Octopus_Api_Key)
-            run_terraform("../terraform/simple/space_population", Octopus_Url, Octopus_Api_Key,
-                          json.loads(output)["octopus_space_id"]["value"])
-            run_terraform("../terraform/empty/space_creation", Octopus_Url, Octopus_Api_Key)
+            start_octopus()
         except Exception as e:
             print("Failed to start containers. Consider running ryuk in privileged mode by setting "
                   + "TESTCONTAINERS_RYUK_PRIVILEGED=true or disabling ryuk by setting "
                   + "TESTCONTAINERS_RYUK_DISABLED=true.")
             print(e)
-            cls.tearDownClass()
-
-    @classmethod
-    def tearDownClass(cls):
-        try:
-            cls.octopus.stop()
-        except Exception as e:
-            pass
-        finally:
-            cls.octopus = None
-
-        try:
-            cls.mssql.stop()
-        except Exception as e:
-            pass
-        finally:
-            cls.mssql = None
 
     def test_health(self):
         health_internal()
@@ -1,6 +1,8 @@
+import inspect
 import unittest
 
 from domain.tools.wrapper.function_definition import FunctionDefinition, FunctionDefinitions
+from domain.tools.wrapper.general_query import answer_general_query_wrapper, AnswerGeneralQuery
 
 
 class FunctionDefinitionTest(unittest.TestCase):
@@ -47,3 +49,11 @@ class FunctionDefinitionTest(unittest.TestCase):
         self.assertEqual(enabled_function, functions.get_function("enabled_function"))
 
         self.assertEqual(2, len(functions.get_tools()))
+
+    def test_tool_arguments_from_signature(self):
+        answer_general_query = answer_general_query_wrapper("query", lambda query, body, messages: body)
+        function = FunctionDefinition(answer_general_query, schema=AnswerGeneralQuery)
+
+        # The schema is not used as the tool's coroutine or arguments
+        self.assertIsNone(function.tool.coroutine)
+        self.assertEqual(set(function.tool.args), set(inspect.signature(answer_general_query).parameters))
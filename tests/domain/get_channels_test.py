@@ -0,0 +1,50 @@
+import unittest
+from unittest.mock import patch
+
+from domain.view.markdown.markdown_dashboards import get_channels, get_project_tenant_progression_response
+
+
+def fake_channel(space_id, channel_id, api_key, url):
+    return {"Id": channel_id, "Name": channel_id + " name"}
+
+
+dashboard = {
+    "Environments": [{"Id": "Environments-1", "Name": "Dev"}, {"Id": "Environments-2", "Name": "Prod"}],
+    "Tenants": [{"Id": "Tenants-1", "Name": "Tenant 1", "ProjectEnvironments": {"Projects-1": ["Environments-1"]}}],
+    "Items": [
+        {"TenantId": "Tenants-1", "EnvironmentId": "Environments-1", "ChannelId": "Channels-1",
+         "ProjectId": "Projects-1", "ReleaseId": "Releases-1", "ReleaseVersion": "1.0.0",
+         "DeploymentId": "Deployments-1", "State": "Success", "HasWarningsOrErrors": False,
+         "Created": "2024-01-01T00:00:00.000+00:00"},
+        # The tenant is not linked to this environment, so the deployment is not displayed
+        {"TenantId": "Tenants-1", "EnvironmentId": "Environments-2", "ChannelId": "Channels-2",
+         "ProjectId": "Projects-1", "ReleaseId": "Releases-2", "ReleaseVersion": "2.0.0",
+         "DeploymentId": "Deployments-2", "State": "Success", "HasWarningsOrErrors": False,
+         "Created": "2024-01-01T00:00:00.000+00:00"}
+    ]
+}
+
+
+class GetChannels(unittest.TestCase):
+    def test_get_channels(self):
+        with patch("domain.view.markdown.markdown_dashboards.get_channel_cached", side_effect=fake_channel):
+            channels = get_channels({"Channels-1", "Channels-2"}, "Spaces-1", "API-XXX", "https://example.org")
+
+        self.assertEqual(channels, {"Channels-1": fake_channel("Spaces-1", "Channels-1", None, None),
+                                    "Channels-2": fake_channel("Spaces-1", "Channels-2", None, None)})
+
+    def test_get_no_channels(self):
+        with patch("domain.view.markdown.markdown_dashboards.get_channel_cached") as get_channel_cached:
+            self.assertEqual(get_channels(set(), "Spaces-1", "API-XXX", "https://example.org"), {})
+            get_channel_cached.assert_not_called()
+
+    def test_only_displayed_channels_fetched(self):
+        with patch("domain.view.markdown.markdown_dashboards.get_channel_cached",
+                   side_effect=fake_channel) as get_channel_cached:
+            response = get_project_tenant_progression_response("Spaces-1", "Space", "Project", "Projects-1", dashboard,
+                                                               None, None, None, None, None, None, "API-XXX",
+                                                               "https://example.org")
+
+        self.assertEqual([call.args[1] for call in get_channel_cached.call_args_list], ["Channels-1"])
+        self.assertIn("Channels-1 name", response)
+        self.assertNotIn("2.0.0", response)
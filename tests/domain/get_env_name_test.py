@@ -0,0 +1,18 @@
+import unittest
+
+from domain.view.markdown.markdown_dashboards import get_env_name, get_environment_names_by_id
+
+dashboard = {"Environments": [{"Id": "Environments-1", "Name": "Development"},
+                              {"Id": "Environments-2", "Name": "Production"}]}
+
+
+class GetEnvNameTest(unittest.TestCase):
+    def test_get_env_name(self):
+        environment_names_by_id = get_environment_names_by_id(dashboard)
+        self.assertEqual(get_env_name(environment_names_by_id, "Environments-1"), "Development")
+        self.assertEqual(get_env_name(environment_names_by_id, "Environments-2"), "Production")
+        self.assertIsNone(get_env_name(environment_names_by_id, "Environments-3"))
+
+    def test_get_env_name_from_dashboard(self):
+        self.assertEqual(get_env_name(dashboard, "Environments-2"), "Production")
+        self.assertIsNone(get_env_name(dashboard, "Environments-3"))
@@ -9,6 +9,10 @@ class EnsureTests(unittest.TestCase):
                          "I found 1 projects in the space \"Default\":\n* Deploy Web App Container")
         self.assertEqual(get_octopus_project_names_response("", ["Deploy Web App Container"]),
                          "I found 1 projects:\n* Deploy Web App Container")
+        self.assertEqual(get_octopus_project_names_response(None, ["Project 1", "Project 2"]),
+                         "I found 2 projects:\n* Project 1\n* Project 2")
+        self.assertEqual(get_octopus_project_names_response("Default", ["Project 1", "Project 2"]),
+                         "I found 2 projects in the space \"Default\":\n* Project 1\n* Project 2")
         self.assertEqual(get_octopus_project_names_response("", []),
                          "I found no projects.")
         self.assertEqual(get_octopus_project_names_response(None, None),
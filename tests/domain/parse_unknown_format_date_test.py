@@ -0,0 +1,25 @@
+import unittest
+from datetime import datetime, timezone, timedelta
+
+from domain.date.parse_dates import parse_unknown_format_date
+
+
+class ParseUnknownFormatDateTest(unittest.TestCase):
+    def test_parse_iso_dates(self):
+        self.assertEqual(parse_unknown_format_date("2024-06-06T00:30:58.602+00:00"),
+                         datetime(2024, 6, 6, 0, 30, 58, 602000, tzinfo=timezone.utc))
+        self.assertEqual(parse_unknown_format_date("2024-06-06T00:30:58Z"),
+                         datetime(2024, 6, 6, 0, 30, 58, tzinfo=timezone.utc))
+        self.assertEqual(parse_unknown_format_date("2024-06-06T10:30:58.6020000+10:00"),
+                         datetime(2024, 6, 6, 0, 30, 58, 602000, tzinfo=timezone.utc))
+        self.assertEqual(parse_unknown_format_date("2024-06-06T00:30:58-05:30").utcoffset(),
+                         timedelta(hours=-5, minutes=-30))
+
+    def test_parse_dates_without_timezone(self):
+        self.assertEqual(parse_unknown_format_date("2024-06-06"), datetime(2024, 6, 6, tzinfo=timezone.utc))
+        self.assertEqual(parse_unknown_format_date("1 Jan 2024"), datetime(2024, 1, 1, tzinfo=timezone.utc))
+
+    def test_parse_invalid_dates(self):
+        self.assertIsNone(parse_unknown_format_date(None))
+        self.assertIsNone(parse_unknown_format_date(""))
+        self.assertIsNone(parse_unknown_format_date("not a date"))
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+import domain.tools.wrapper.general_query as general_query
+from domain.sanitizers.sanitized_list import sanitize_space, sanitize_environments, sanitize_variables
+from domain.tools.wrapper.general_query import sanitize_entities, entity_sanitizers
+
+query = "Show the variables of the \"Deploy WebApp\" project in the Development environment of the \"Default\" space"
+
+
+def mock_sanitizers():
+    """
+    Replaces each sanitizer in the table with a mock that wraps it, so the calls can be inspected
+    :return: The patched table, and the mocks keyed by the wrapped sanitizer
+    """
+    mocks = {sanitizer: MagicMock(wraps=sanitizer) for _, sanitizer, _ in entity_sanitizers}
+    table = tuple((body_key, mocks[sanitizer], argument, sanitizer in general_query.query_aware_sanitizers)
+                  for body_key, sanitizer, argument in entity_sanitizers)
+    return patch.object(general_query, "resolved_entity_sanitizers", table), mocks
+
+
+class SanitizeEntitiesTest(unittest.TestCase):
+    def test_sanitize_entities(self):
+        body = sanitize_entities(query, {"space": "Default",
+                                         "projects": ["Deploy WebApp", "Project 1"],
+                                         "environments": ["Development", "Production"],
+                                         "variables": ["Database.Name", "var1", "*"],
+                                         "runbooks": None,
+                                         "targets": "",
+                                         "tenants": []})
+
+        self.assertEqual(body["space_name"], "Default")
+        self.assertEqual(body["project_names"], ["Deploy WebApp"])
+        # Environments not mentioned in the query are removed
+        self.assertEqual(body["environment_names"], ["Development"])
+        self.assertEqual(body["variable_names"], ["Database.Name"])
+        self.assertEqual(body["runbook_names"], [])
+        self.assertEqual(body["target_names"], [])
+        self.assertEqual(body["tenant_names"], [])
+        self.assertEqual(set(body), {body_key for body_key, _, _ in entity_sanitizers})
+
+    def test_missing_arguments(self):
+        body = sanitize_entities("Show me the projects", {})
+
+        self.assertIsNone(body["space_name"])
+        for body_key, value in body.items():
+            if body_key != "space_name":
+                self.assertEqual(value, [], body_key)
+
+    def test_query_aware_sanitizers(self):
+        patched, mocks = mock_sanitizers()
+        with patched:
+            sanitize_entities(query, {"space": "Default", "environments": ["Development"]})
+
+        mocks[sanitize_space].assert_called_once_with(query, "Default")
+        mocks[sanitize_environments].assert_called_once_with(query, ["Development"])
+
+    def test_query_aware_sanitizers_always_called(self):
+        patched, mocks = mock_sanitizers()
+        with patched:
+            sanitize_entities(query, {})
+
+        mocks[sanitize_space].assert_called_once_with(query, None)
+        mocks[sanitize_environments].assert_called_once_with(query, None)
+        self.assertEqual([sanitizer for sanitizer, mock in mocks.items() if mock.called],
+                         [sanitize_space, sanitize_environments])
+
+    def test_variables_sanitizer(self):
+        patched, mocks = mock_sanitizers()
+        with patched:
+            body = sanitize_entities(query, {"variables": ["Database.Name"]})
+
+        mocks[sanitize_variables].assert_called_once_with(["Database.Name"])
+        self.assertEqual(body["variable_names"], ["Database.Name"])
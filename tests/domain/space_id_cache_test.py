@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import patch
+
+from expiring_dict import ExpiringDict
+
+import infrastructure.octopus as octopus
+from domain.config.octopus import space_id_cache_ttl
+
+
+class SpaceIdCacheTest(unittest.TestCase):
+    def setUp(self):
+        lookup = patch.object(octopus, "lookup_space_id_and_name", side_effect=lambda name, key, url: (name, name))
+        self.lookup = lookup.start()
+        self.addCleanup(lookup.stop)
+
+    def test_same_request_cached(self):
+        with patch.object(octopus, "space_id_cache", ExpiringDict(space_id_cache_ttl)):
+            for _ in range(2):
+                self.assertEqual(octopus.get_space_id_and_name_from_name("Default", "API-ONE", "https://a.org"),
+                                 ("Default", "Default"))
+
+            self.assertEqual(self.lookup.call_count, 1)
+
+    def test_different_api_key_not_cached(self):
+        with patch.object(octopus, "space_id_cache", ExpiringDict(space_id_cache_ttl)):
+            octopus.get_space_id_and_name_from_name("Default", "API-ONE", "https://a.org")
+            octopus.get_space_id_and_name_from_name("Default", "API-TWO", "https://a.org")
+
+            self.assertEqual(self.lookup.call_count, 2)
+
+    def test_different_url_not_cached(self):
+        with patch.object(octopus, "space_id_cache", ExpiringDict(space_id_cache_ttl)):
+            octopus.get_space_id_and_name_from_name("Default", "API-ONE", "https://a.org")
+            octopus.get_space_id_and_name_from_name("Default", "API-ONE", "https://b.org")
+
+            self.assertEqual(self.lookup.call_count, 2)
+
+    def test_api_key_not_stored(self):
+        with patch.object(octopus, "space_id_cache", ExpiringDict(space_id_cache_ttl)):
+            octopus.get_space_id_and_name_from_name("Default", "API-ONE", "https://a.org")
+
+            self.assertNotIn("API-ONE", repr(list(octopus.space_id_cache.keys())))
+
+    def test_entry_expires(self):
+        now = [1000.0]
+        with patch("expiring_dict.expiringdict.time", lambda: now[0]), \
+                patch.object(octopus, "space_id_cache", ExpiringDict(space_id_cache_ttl)):
+            octopus.get_space_id_and_name_from_name("Default", "API-ONE", "https://a.org")
+
+            now[0] += space_id_cache_ttl - 1
+            octopus.space_id_cache.flush()
+            octopus.get_space_id_and_name_from_name("Default", "API-ONE", "https://a.org")
+            self.assertEqual(self.lookup.call_count, 1)
+
+            now[0] += 2
+            octopus.space_id_cache.flush()
+            octopus.get_space_id_and_name_from_name("Default", "API-ONE", "https://a.org")
+            self.assertEqual(self.lookup.call_count, 2)
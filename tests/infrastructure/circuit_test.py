@@ -0,0 +1,85 @@
+import unittest
+from unittest.mock import patch
+
+from domain.exceptions.circuit_open import CircuitOpen
+import infrastructure.circuit as circuit
+from infrastructure.circuit import CircuitBreaker, get_circuit_breaker
+
+
+def fail():
+    raise ValueError("failed")
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker("example.org", threshold=2, recovery=60)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                breaker.call(fail)
+
+        with self.assertRaises(CircuitOpen):
+            breaker.call(lambda: 1)
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker("example.org", threshold=2, recovery=60)
+        with self.assertRaises(ValueError):
+            breaker.call(fail)
+        self.assertEqual(breaker.call(lambda: 1), 1)
+        with self.assertRaises(ValueError):
+            breaker.call(fail)
+        self.assertEqual(breaker.call(lambda: 2), 2)
+
+    def test_failed_result(self):
+        breaker = CircuitBreaker("example.org", threshold=1, recovery=60)
+        self.assertEqual(breaker.call(lambda: 500, lambda status: status >= 500), 500)
+        with self.assertRaises(CircuitOpen):
+            breaker.call(lambda: 200)
+
+    def test_half_open(self):
+        breaker = CircuitBreaker("example.org", threshold=1, recovery=0)
+        with self.assertRaises(ValueError):
+            breaker.call(fail)
+
+        # The recovery time has passed, so a failed test request opens the circuit again
+        with self.assertRaises(ValueError):
+            breaker.call(fail)
+
+        self.assertEqual(breaker.call(lambda: 1), 1)
+        self.assertEqual(breaker.call(lambda: 2), 2)
+
+    def test_breaker_per_host(self):
+        self.assertIs(get_circuit_breaker("https://example.org/a"), get_circuit_breaker("https://example.org/b"))
+        self.assertIsNot(get_circuit_breaker("https://example.org/a"), get_circuit_breaker("https://hooks.slack.com"))
+
+    def test_breaker_per_scope(self):
+        self.assertIs(get_circuit_breaker("https://example.org/a", "https://a.octopus.app"),
+                      get_circuit_breaker("https://example.org/b", "https://a.octopus.app"))
+        self.assertIsNot(get_circuit_breaker("https://example.org/a", "https://a.octopus.app"),
+                         get_circuit_breaker("https://example.org/a", "https://b.octopus.app"))
+
+    def test_interrupted_half_open(self):
+        breaker = CircuitBreaker("example.org", threshold=1, recovery=0)
+        with self.assertRaises(ValueError):
+            breaker.call(fail)
+
+        def interrupt():
+            raise KeyboardInterrupt()
+
+        # An interrupted test request opens the circuit again rather than leaving it half open
+        with self.assertRaises(KeyboardInterrupt):
+            breaker.call(interrupt)
+
+        self.assertEqual(breaker.call(lambda: 1), 1)
+
+    def test_breakers_bounded(self):
+        with patch.object(circuit, "max_circuit_breakers", 2):
+            first = get_circuit_breaker("https://example.org", "https://a.octopus.app")
+            get_circuit_breaker("https://example.org", "https://b.octopus.app")
+
+            # Using the first breaker makes the second the least recently used
+            self.assertIs(get_circuit_breaker("https://example.org", "https://a.octopus.app"), first)
+            get_circuit_breaker("https://example.org", "https://c.octopus.app")
+
+            self.assertLessEqual(len(circuit.circuit_breakers), 2)
+            self.assertIn(("example.org", "https://a.octopus.app"), circuit.circuit_breakers)
+            self.assertNotIn(("example.org", "https://b.octopus.app"), circuit.circuit_breakers)
@@ -1,15 +1,9 @@
 import json
-import os
-import shutil
-import subprocess
-import tempfile
 import time
 import unittest
 
 from parameterized import parameterized
 from retry import retry
-from testcontainers.core.container import DockerContainer
-from testcontainers.core.waiting_utils import wait_for_logs
 
 from domain.config.octopus import min_octopus_version
 from domain.exceptions.resource_not_found import ResourceNotFound
@@ -28,6 +22,7 @@ from infrastructure.octopus import get_project_progression, get_raw_deployment_p
 from tests.infrastructure.create_and_deploy_release import create_and_deploy_release, wait_for_task
 from tests.infrastructure.octopus_config import Octopus_Api_Key, Octopus_Url
 from tests.infrastructure.publish_runbook import publish_runbook
+from tests.infrastructure.start_octopus import start_octopus
 
 logger = configure_logging(__name__)
 
@@ -40,38 +35,7 @@ class OctopusAPIRequests(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        cls.mssql = DockerContainer("mcr.microsoft.com/mssql/server:2022-latest").with_env(
-            "ACCEPT_EULA", "True").with_env("SA_PASSWORD", "Password01!")
-        cls.mssql.start()
-        wait_for_logs(cls.mssql, "SQL Server is now ready for client connections")
-
-        mssql_ip = cls.mssql.get_docker_client().bridge_ip(cls.mssql.get_wrapped_container().id)
-
-        cls.octopus = DockerContainer("octopusdeploy/octopusdeploy").with_bind_ports(8080, 8080).with_env(
-            "ACCEPT_EULA", "Y").with_env("DB_CONNECTION_STRING",
-                                         "Server=" + mssql_ip + ",1433;Database=OctopusDeploy;User=sa;Password=Password01!").with_env(
-            "ADMIN_API_KEY", Octopus_Api_Key).with_env("DISABLE_DIND", "Y").with_env(
-            "ADMIN_USERNAME", "admin").with_env("ADMIN_PASSWORD", "Password01!").with_env(
-            "OCTOPUS_SERVER_BASE64_LICENSE", os.environ["LICENSE"]).with_env("ENABLE_USAGE", "N")
-        cls.octopus.start()
-        wait_for_logs(cls.octopus, "Web server is ready to process requests")
-
-        output = run_terraform("../terraform/simple/space_creation", Octopus_Url, Octopus_Api_Key)
-        run_terraform("../terraform/simple/space_population", Octopus_Url, Octopus_Api_Key,
-                      json.loads(output)["octopus_space_id"]["value"])
-        run_terraform("../terraform/empty/space_creation", Octopus_Url, Octopus_Api_Key)
-
-    @classmethod
-    def tearDownClass(cls):
-        try:
-            cls.octopus.stop()
-        except Exception as e:
-            pass
-
-        try:
-            cls.mssql.stop()
-        except Exception as e:
-            pass
+        start_octopus()
 
     def test_version(self):
         self.assertTrue(octopus_version_at_least(get_version(Octopus_Url), min_octopus_version))
@@ -471,20 +435,5 @@ class UnitTests(unittest.TestCase):
         self.assertEqual("test", get_item_fuzzy([{"Name": "test"}, {"Name": "Test"}], "test")["Name"])
 
 
-def run_terraform(directory, url, api, space=None):
-    with tempfile.TemporaryDirectory() as temp_dir:
-        shutil.copytree(os.path.abspath(os.path.join(os.path.dirname(__file__), directory)), temp_dir,
-                        dirs_exist_ok=True)
-        subprocess.run(["terraform", "init"], check=True, cwd=temp_dir)
-
-        args = ["terraform", "apply", "-auto-approve", "-var=octopus_server=" + url, "-var=octopus_apikey=" + api]
-        if space is not None:
-            args.append("-var=octopus_space_id=" + space)
-
-        subprocess.run(args, check=True, cwd=temp_dir)
-        output = subprocess.run(["terraform", "output", "-json"], check=True, cwd=temp_dir, capture_output=True)
-        return output.stdout
-
-
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+
+import orjson
+
+from domain.config.openai import max_context
+from domain.query.query_inspector import exclude_all_steps
+from domain.sanitizers.sanitized_list import sanitize_projects, sanitize_tenants, sanitize_targets, \
+    sanitize_runbooks, sanitize_library_variable_sets, sanitize_environments, sanitize_feeds, sanitize_accounts, \
+    sanitize_certificates, sanitize_lifecycles, sanitize_workerpools, sanitize_machinepolicies, sanitize_tenanttagsets, \
+    sanitize_projectgroups, sanitize_steps, sanitize_variables
+from infrastructure.octoterra import build_octoterra_body, freeze_names, includes_all_projects, includes_all_tenants, \
+    include_all_targets, include_all_environments, include_all_feeds, include_all_accounts, include_all_certificates, \
+    include_all_lifecycles, include_all_workerpools, include_all_machinepolicies, include_all_runbooks, \
+    include_all_projectgroups, include_all_variables, include_all_library_variable_sets, include_all_tagsets
+
+
+def build_baseline_body(query, space_id, project_names, runbook_names, target_names, tenant_names,
+                        library_variable_sets, environment_names, feed_names, account_names, certificate_names,
+                        lifecycle_names, workerpool_names, machinepolicy_names, tagset_names, projectgroup_names,
+                        step_names, variable_names):
+    """
+    Builds the request body the way get_octoterra_space did before the body was cached, using the names
+    exactly as they were supplied by the LLM
+    """
+    sanitized_environments = sanitize_environments(query, environment_names)
+    sanitized_step_names = sanitize_steps(step_names)
+
+    include_all_resources = []
+    results = {}
+    for name, include_all, sanitized in [
+        ("Projects", includes_all_projects, sanitize_projects(project_names)),
+        ("Tenants", includes_all_tenants, sanitize_tenants(tenant_names)),
+        ("Targets", include_all_targets, sanitize_targets(target_names)),
+        ("Environments", include_all_environments, sanitized_environments),
+        ("Feeds", include_all_feeds, sanitize_feeds(feed_names)),
+        ("Accounts", include_all_accounts, sanitize_accounts(account_names)),
+        ("Certificates", include_all_certificates, sanitize_certificates(certificate_names)),
+        ("Lifecycles", include_all_lifecycles, sanitize_lifecycles(lifecycle_names)),
+        ("WorkerPools", include_all_workerpools, sanitize_workerpools(workerpool_names)),
+        ("MachinePolicies", include_all_machinepolicies, sanitize_machinepolicies(machinepolicy_names)),
+        ("Runbooks", include_all_runbooks, sanitize_runbooks(runbook_names)),
+        ("ProjectGroups", include_all_projectgroups, sanitize_projectgroups(projectgroup_names)),
+        ("ProjectVariables", include_all_variables, sanitize_variables(variable_names)),
+        ("LibraryVariableSets", include_all_library_variable_sets,
+         sanitize_library_variable_sets(library_variable_sets)),
+        ("TenantTagSets", include_all_tagsets, sanitize_tenanttagsets(tagset_names)),
+    ]:
+        exclude_all, exclude_except, resources = include_all(query, sanitized)
+        results[name] = exclude_all, exclude_except
+        include_all_resources += resources
+
+    body = {
+        "space": space_id,
+        "ignoreCacManagedValues": False,
+        "excludeCaCProjectSettings": True,
+        "excludeAllSteps": exclude_all_steps(query, sanitized_step_names),
+        "limitAttributeLength": 100,
+        "ignoreInvalidExcludeExcept": True,
+        "excludeTerraformVariables": True,
+        "excludeSpaceCreation": True,
+        "excludeProvider": True,
+        "includeIds": True,
+        "includeSpaceInPopulation": True,
+        "excludeTargetsWithNoEnvironments": len(sanitized_environments) != 0,
+        "limitResourceCount": max_context,
+        "includeDefaultChannel": True,
+    }
+
+    for name, (exclude_all, exclude_except) in results.items():
+        body["excludeAll" + name] = exclude_all
+        body["exclude" + name + "Except"] = exclude_except
+
+    return body, include_all_resources
+
+
+def build_body(query, names):
+    body, include_all_resources = build_octoterra_body(query, "Spaces-1", *map(freeze_names, names))
+    return orjson.loads(body), list(include_all_resources)
+
+
+class OctoterraBodyTest(unittest.TestCase):
+    def assert_body_unchanged(self, query, names):
+        self.assertEqual(build_body(query, names), build_baseline_body(query, "Spaces-1", *names))
+
+    def test_no_names(self):
+        self.assert_body_unchanged("Show me the projects", [None] * 16)
+
+    def test_string_names(self):
+        self.assert_body_unchanged("What does the project \"Deploy WebApp\" do in the Development environment?",
+                                   ["Deploy WebApp", None, None, None, None, "Development"] + [None] * 10)
+
+    def test_list_names(self):
+        names = [["Deploy WebApp", "Web"], ["Backup"], ["Target 1"], ["Tenant 1"], ["Variables"],
+                 ["Development", "Production"], ["Docker Hub"], ["AWS"], ["Cert"], ["Default Lifecycle"],
+                 ["Hosted Ubuntu"], ["Default Machine Policy"], ["Regions"], ["Default Project Group"],
+                 ["Deploy"], ["Database.Name"]]
+        self.assert_body_unchanged("Show me the Deploy step of the Deploy WebApp project", names)
+
+    def test_mixed_list_names(self):
+        names = [["Deploy WebApp", 1, None, {"Name": "Web"}], [True, "Backup"]] + [[None, 2.5]] * 14
+        self.assert_body_unchanged("Show me the Deploy WebApp project", names)
+
+    def test_bool_names(self):
+        self.assert_body_unchanged("Show me all the projects and tenants", [True, False] * 8)
+
+    def test_include_all_resources(self):
+        query = "List the projects, tenants and environments"
+        body, include_all_resources = build_body(query, [None] * 16)
+        self.assertEqual(include_all_resources, ["projects", "tenants", "environments"])
+        self.assertEqual(include_all_resources, build_baseline_body(query, "Spaces-1", *[None] * 16)[1])
+
+        # The result of the cached call is not affected by a caller changing the returned list
+        include_all_resources.append("changed")
+        self.assertEqual(build_body(query, [None] * 16)[1], ["projects", "tenants", "environments"])
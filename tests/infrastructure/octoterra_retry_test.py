@@ -0,0 +1,78 @@
+import http.server
+import threading
+import unittest
+from unittest.mock import patch
+
+import infrastructure.octoterra as octoterra
+from domain.exceptions.request_failed import OctopusRequestFailed
+from infrastructure.circuit import get_circuit_breaker
+
+
+class OctoterraHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Responds with the queued status codes, and then with a 200
+    """
+    statuses = []
+    requests = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        OctoterraHandler.requests += 1
+        status = OctoterraHandler.statuses.pop(0) if OctoterraHandler.statuses else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "3")
+        self.end_headers()
+        self.wfile.write(b"hcl")
+
+    def log_message(self, *args):
+        pass
+
+
+class OctoterraRetryTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), OctoterraHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        OctoterraHandler.statuses = []
+        OctoterraHandler.requests = 0
+
+        self.url = f"http://127.0.0.1:{self.server.server_port}/api/octoterra"
+        # Each test uses its own circuit, and skips the backoff between retries to keep the test fast
+        self.headers = {"X-Octopus-ApiKey": "API-XXX", "X-Octopus-Url": "https://" + self.id()}
+        for patcher in [patch.object(octoterra, "get_octoterra_url", lambda: self.url),
+                        patch.object(octoterra, "octoterra_retries",
+                                     octoterra.octoterra_retries.new(backoff_factor=0, backoff_jitter=0))]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_retry_transient_failure(self):
+        OctoterraHandler.statuses = [503]
+
+        self.assertEqual(octoterra.export_space(b"{}", self.headers), "hcl")
+        self.assertEqual(OctoterraHandler.requests, 2)
+
+    def test_retries_exhausted(self):
+        OctoterraHandler.statuses = [503, 502, 504]
+
+        # The last response is passed to handle_response rather than urllib3 raising MaxRetryError
+        with self.assertRaises(OctopusRequestFailed):
+            octoterra.export_space(b"{}", self.headers)
+
+        self.assertEqual(OctoterraHandler.requests, 3)
+        self.assertEqual(get_circuit_breaker(self.url, self.headers["X-Octopus-Url"]).failures, 1)
+
+    def test_client_error_not_retried(self):
+        OctoterraHandler.statuses = [400]
+
+        with self.assertRaises(OctopusRequestFailed):
+            octoterra.export_space(b"{}", self.headers)
+
+        self.assertEqual(OctoterraHandler.requests, 1)
+        self.assertEqual(get_circuit_breaker(self.url, self.headers["X-Octopus-Url"]).failures, 0)
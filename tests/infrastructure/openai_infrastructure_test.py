@@ -4,8 +4,9 @@ import unittest
 from openai import RateLimitError
 from retry import retry
 
-from infrastructure.openai import llm_tool_query, llm_message_query
+from infrastructure.openai import llm_message_query
 from tests.infrastructure.tools.build_test_tools import build_mock_test_tools
+from tests.infrastructure.tools.cached_llm_tool_query import cached_llm_tool_query
 
 
 class MockRequests(unittest.TestCase):
@@ -28,7 +29,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "What is the size of the earth?"
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
 
         self.assertTrue("Sorry, I did not understand that request." in function.call_function().response)
 
@@ -39,7 +40,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "What does the project \"Deploy WebApp\" do?"
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -52,7 +53,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "What is the description of the \"Azure Apps\" project group?"
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -65,7 +66,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "What is the description of the \"Backup Database\" runbook defined in the \"Runbook Project\" project."
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -78,7 +79,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "Describe the \"Team A\" tenant."
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -91,7 +92,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "Does the \"Helm\" feed have a password?."
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -105,7 +106,7 @@ class MockRequests(unittest.TestCase):
 
         query = "What is the access key of the \"AWS Account\" account?."
 
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -118,7 +119,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "List the variables belonging to the \"Database Settings\" library variable set."
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -131,7 +132,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "What is the description of the \"Docker\" worker pool?"
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -144,7 +145,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "What is the note of the \"Kind CA\" certificate?"
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -157,7 +158,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "List the tags associated with the \"region\" tag set?"
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -170,7 +171,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "What environments are in the \"Simple\" lifecycle?"
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -183,7 +184,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "What is the username for the git credentials called \"GitHub Credentials\"?"
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -196,7 +197,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "Show the powershell health check script for the \"Windows VM Policy\" machine policy."
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -209,7 +210,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "List the variables scoped to the \"Development\" environment in the project \"Deploy WebApp\"."
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -226,7 +227,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "Find steps in the \"Commercial Billing\" project with a type of \"Octopus.Manual\". Double check the type of each step to ensure it is \"Octopus.Manual\". Show the step name and type in a markdown table."
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
 
         # Not raising an exception here is the test
         function.call_function()
@@ -240,7 +241,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "Where is the variable \"Database\" used in the project \"Project1\"?"
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -253,7 +254,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "What do does the step \"Manual Intervention\" in the \"Project1\" do?"
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -266,7 +267,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "Find deployments after \"1st Jan 2024\" and before \"2nd Mar 2024\"?"
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query", body)
@@ -280,7 +281,7 @@ class MockRequests(unittest.TestCase):
         """
 
         query = "Show the details of the machine \"Cloud Region target\"?"
-        function = llm_tool_query(query, build_mock_test_tools(query))
+        function = cached_llm_tool_query(query, build_mock_test_tools(query))
         body = function.call_function()
 
         self.assertEqual(function.name, "answer_general_query")
@@ -304,7 +305,7 @@ class MockRequests(unittest.TestCase):
                    "How do I enable Config-as-code?", ]
 
         for query in queries:
-            query_result = llm_tool_query(query, build_mock_test_tools(query))
+            query_result = cached_llm_tool_query(query, build_mock_test_tools(query))
             self.assertIn(query_result.name, docs_tools, query + " " + query_result.name)
             print(query_result.name)
 
@@ -0,0 +1,32 @@
+import glob
+import os
+import subprocess
+import tempfile
+
+# Providers are cached between runs so "terraform init" does not download them every time
+plugin_cache_dir = os.path.expanduser(os.path.join("~", ".terraform.d", "plugin-cache"))
+
+
+def run_terraform(directory, url, api, space=None):
+    os.makedirs(plugin_cache_dir, exist_ok=True)
+    env = {**os.environ, "TF_PLUGIN_CACHE_DIR": plugin_cache_dir}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Link the configuration files rather than copying them. Only the *.tf files are linked, so any state,
+        # lock file, or .terraform directory left in the source directory is not shared with this run.
+        source_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), directory))
+        for file in glob.glob(os.path.join(source_dir, "*.tf")):
+            os.symlink(file, os.path.join(temp_dir, os.path.basename(file)))
+
+        subprocess.run(["terraform", "init", "-input=false", "-no-color"], check=True, cwd=temp_dir, env=env)
+
+        # Raise the parallelism to create the independent Octopus resources concurrently
+        args = ["terraform", "apply", "-auto-approve", "-input=false", "-no-color", "-parallelism=20",
+                "-var=octopus_server=" + url, "-var=octopus_apikey=" + api]
+        if space is not None:
+            args.append("-var=octopus_space_id=" + space)
+
+        subprocess.run(args, check=True, cwd=temp_dir, env=env)
+        output = subprocess.run(["terraform", "output", "-json"], check=True, cwd=temp_dir, capture_output=True,
+                                env=env)
+        return output.stdout
@@ -0,0 +1,77 @@
+import queue
+import unittest
+from unittest.mock import patch, MagicMock
+
+import infrastructure.slack as slack
+
+slack_url = "https://hooks.slack.com/services/test"
+
+
+class SlackTest(unittest.TestCase):
+    def test_message_queued(self):
+        with patch.object(slack, "slack_queue", queue.Queue(maxsize=2)), \
+                patch.object(slack, "start_slack_worker"):
+            slack.send_slack_message("message", slack_url)
+            self.assertEqual(slack.slack_queue.get_nowait(), ("message", slack_url))
+
+    def test_queue_is_bounded(self):
+        with patch.object(slack, "slack_queue", queue.Queue(maxsize=2)), \
+                patch.object(slack, "start_slack_worker"):
+            for message in ["first", "second", "third"]:
+                slack.send_slack_message(message, slack_url)
+
+            # The oldest message is dropped to make room for the newest message
+            self.assertEqual(slack.slack_queue.qsize(), 2)
+            self.assertEqual(slack.slack_queue.get_nowait(), ("second", slack_url))
+            self.assertEqual(slack.slack_queue.get_nowait(), ("third", slack_url))
+
+    def test_empty_url(self):
+        with patch.object(slack, "slack_queue", queue.Queue(maxsize=2)), \
+                patch.object(slack, "start_slack_worker"):
+            with self.assertRaises(ValueError):
+                slack.send_slack_message("message", "")
+            self.assertTrue(slack.slack_queue.empty())
+
+    def test_worker_sends_message(self):
+        with patch.object(slack, "slack_queue", queue.Queue(maxsize=2)), \
+                patch.object(slack, "post_slack_message") as post_slack_message:
+            slack.slack_queue.put_nowait(("message", slack_url))
+            slack.send_next_slack_message()
+
+            post_slack_message.assert_called_once_with("message", slack_url)
+            self.assertEqual(slack.slack_queue.unfinished_tasks, 0)
+
+    def test_failed_message_marked_done(self):
+        with patch.object(slack, "slack_queue", queue.Queue(maxsize=2)), \
+                patch.object(slack, "post_slack_message", side_effect=Exception("failed")):
+            slack.slack_queue.put_nowait(("message", slack_url))
+            with self.assertRaises(Exception):
+                slack.send_next_slack_message()
+
+            # The message is marked as done so the queue does not wait on it forever
+            self.assertEqual(slack.slack_queue.unfinished_tasks, 0)
+
+    def test_worker_started_once(self):
+        thread = MagicMock()
+        with patch.object(slack, "slack_queue", queue.Queue(maxsize=2)), \
+                patch.object(slack, "slack_worker", None), \
+                patch.object(slack, "Thread", return_value=thread) as thread_class:
+            slack.send_slack_message("first", slack_url)
+            slack.send_slack_message("second", slack_url)
+
+            thread_class.assert_called_once()
+            thread.start.assert_called_once()
+
+    def test_worker_survives_failure(self):
+        # The worker loop runs forever, so the last message stops it with an exception the loop does not catch
+        with patch.object(slack, "slack_queue", queue.Queue(maxsize=3)), \
+                patch.object(slack, "post_slack_message",
+                             side_effect=[Exception("failed"), None, KeyboardInterrupt()]) as post_slack_message:
+            for message in ["first", "second", "third"]:
+                slack.slack_queue.put_nowait((message, slack_url))
+
+            with self.assertRaises(KeyboardInterrupt):
+                slack.send_queued_slack_messages()
+
+            self.assertEqual(post_slack_message.call_count, 3)
+            self.assertEqual(slack.slack_queue.unfinished_tasks, 0)
@@ -0,0 +1,78 @@
+import atexit
+import json
+import os
+
+from testcontainers.core.container import DockerContainer
+from testcontainers.core.waiting_utils import wait_for_logs
+
+from domain.logging.app_logging import configure_logging
+from tests.infrastructure.octopus_config import Octopus_Api_Key, Octopus_Url
+from tests.infrastructure.run_terraform import run_terraform
+
+logger = configure_logging(__name__)
+
+# Starting Octopus and populating the test spaces takes several minutes, so the containers are
+# started once and shared by every test class in the test run.
+containers = []
+octopus_started = False
+
+
+def start_octopus():
+    """
+    Starts the MSSQL and Octopus containers and creates the test spaces, unless an earlier test class already did
+    """
+    global octopus_started
+
+    if octopus_started:
+        return
+
+    try:
+        mssql = DockerContainer("mcr.microsoft.com/mssql/server:2022-latest").with_env(
+            "ACCEPT_EULA", "True").with_env("SA_PASSWORD", "Password01!")
+        containers.append(mssql)
+        mssql.start()
+        wait_for_logs(mssql, "SQL Server is now ready for client connections")
+
+        mssql_ip = mssql.get_docker_client().bridge_ip(mssql.get_wrapped_container().id)
+
+        octopus = DockerContainer("octopusdeploy/octopusdeploy").with_bind_ports(8080, 8080).with_env(
+            "ACCEPT_EULA", "Y").with_env("DB_CONNECTION_STRING",
+                                         "Server=" + mssql_ip + ",1433;Database=OctopusDeploy;User=sa;Password=Password01!").with_env(
+            "ADMIN_API_KEY", Octopus_Api_Key).with_env("DISABLE_DIND", "Y").with_env(
+            "ADMIN_USERNAME", "admin").with_env("ADMIN_PASSWORD", "Password01!").with_env(
+            "OCTOPUS_SERVER_BASE64_LICENSE", os.environ["LICENSE"]).with_env("ENABLE_USAGE", "N")
+        containers.append(octopus)
+        octopus.start()
+        wait_for_logs(octopus, "Web server is ready to process requests", timeout=300)
+
+        output = run_terraform("../terraform/simple/space_creation", Octopus_Url, Octopus_Api_Key)
+        run_terraform("../terraform/simple/space_population", Octopus_Url, Octopus_Api_Key,
+                      json.loads(output)["octopus_space_id"]["value"])
+        run_terraform("../terraform/empty/space_creation", Octopus_Url, Octopus_Api_Key)
+    except Exception:
+        # Don't leave a partially configured Octopus instance for the next test class
+        stop_octopus()
+        raise
+
+    octopus_started = True
+
+
+def stop_octopus():
+    """
+    Stops the shared containers
+    """
+    global octopus_started
+
+    octopus_started = False
+
+    # Stop Octopus before the database it depends on
+    while containers:
+        container = containers.pop()
+        try:
+            container.stop()
+        except Exception:
+            # Continue stopping the remaining containers, but leave a record of the one that may still be running
+            logger.exception(f"Failed to stop the container {container.image}")
+
+
+atexit.register(stop_octopus)
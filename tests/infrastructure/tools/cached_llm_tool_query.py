@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from domain.response.copilot_response import CopilotResponse
+from domain.tools.wrapper.function_call import FunctionCall
+from infrastructure.openai import llm_tool_query, NO_FUNCTION_RESPONSE
+
+# The functions selected by the LLM are cached between test runs to avoid the time and cost of repeating the
+# same queries. Set LIVE_TEST_REFRESH_LLM_CACHE=1 to ignore the cache, for example after changing a prompt or tool.
+llm_cache_file = os.path.join(os.path.expanduser("~"), ".cache", "octopus-copilot", "llm_tool_query.json")
+
+# The queries already sent in this test run. Tests are retried when the LLM returns an unexpected answer, so a
+# repeated query is sent to the LLM again rather than replaying the cached answer.
+sent_queries = set()
+
+
+def cached_llm_tool_query(query, functions):
+    """
+    Calls llm_tool_query, reusing the function and arguments selected for the same query in an earlier test run
+    :param query: The plain text query
+    :param functions: The set of tools used by OpenAI
+    :return: The result of the function, defined by the set of tools, that was called in response to the query
+    """
+    cache_key = json.dumps([query, *get_model(), get_tools_hash(functions)])
+    cache = load_llm_cache()
+
+    if cache_key in cache and query not in sent_queries and os.environ.get("LIVE_TEST_REFRESH_LLM_CACHE") != "1":
+        sent_queries.add(query)
+        name, args = cache[cache_key]
+        return build_function_call(functions, name, args)
+
+    sent_queries.add(query)
+    function = llm_tool_query(query, functions)
+
+    cache[cache_key] = [function.name, function.function_args]
+    save_llm_cache(cache)
+
+    return function
+
+
+def get_model():
+    """
+    Gets the deployment and API version used by llm_tool_query, so changing the model does not replay the tools
+    selected by a different model
+    :return: The deployment name and API version
+    """
+    deployment = os.environ.get("OPENAI_API_DEPLOYMENT_FUNCTIONS") or os.environ["OPENAI_API_DEPLOYMENT"]
+    version = os.environ.get("OPENAI_API_DEPLOYMENT_FUNCTIONS_VERSION") or "2024-02-01"
+    return deployment, version
+
+
+def get_tools_hash(functions):
+    """
+    Hashes the tools, including the fallback tools, so changing a tool's name, description, or arguments
+    invalidates the cached answers
+    :param functions: The set of tools used by OpenAI
+    :return: A hash of the tool definitions
+    """
+    tools = []
+    while functions is not None:
+        tools.append([convert_to_openai_tool(tool) for tool in functions.get_tools()])
+        functions = functions.get_fallback_tool()
+    return hashlib.sha256(json.dumps(tools, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def build_function_call(functions, name, args):
+    if name == "none":
+        return FunctionCall(lambda: CopilotResponse(NO_FUNCTION_RESPONSE), name, args)
+
+    # The function may have been selected from one of the fallback tools. get_function() returns the invalid
+    # function for any unknown name, so it is only called once the function is known to exist in the tools.
+    tools = functions
+    while tools is not None:
+        if any(function.enabled and function.name == name for function in tools.functions):
+            return FunctionCall(tools.get_function(name), name, args)
+        tools = tools.get_fallback_tool()
+
+    # The LLM invented a function name, which is handled by the invalid function if there is one
+    return FunctionCall(functions.get_function(name), name, args)
+
+
+def load_llm_cache():
+    try:
+        with open(llm_cache_file) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_llm_cache(cache):
+    os.makedirs(os.path.dirname(llm_cache_file), exist_ok=True)
+    with open(llm_cache_file, "w") as file:
+        json.dump(cache, file, indent=2)